@@ -0,0 +1,84 @@
+# gunicorn.conf.py
+"""
+Профиль запуска gunicorn для production.
+
+Приложение загружается в мастере (preload_app) и разделяется воркерами
+через copy-on-write, воркеры периодически перезапускаются (max_requests).
+При старте каждого воркера в лог пишутся время загрузки и RSS.
+
+Все параметры переопределяются переменными окружения GUNICORN_*.
+"""
+import os
+import time
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "myproject.settings.public")
+
+bind = "0.0.0.0:{}".format(os.getenv("PORT", "8000"))
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-")
+
+
+def memory_usage():
+    """RSS и приватная (не разделяемая с мастером) память процесса, КиБ"""
+    usage = {"rss": 0, "private": 0}
+    try:
+        with open("/proc/self/smaps_rollup") as smaps:
+            for line in smaps:
+                key, _, value = line.partition(":")
+                if key == "Rss":
+                    usage["rss"] = int(value.split()[0])
+                elif key in ("Private_Clean", "Private_Dirty"):
+                    usage["private"] += int(value.split()[0])
+    except OSError:
+        # Не Linux: только пиковый RSS
+        import resource
+        usage["rss"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage
+
+
+def when_ready(server):
+    if preload_app:
+        # Предзагрузка импортирует только WSGI-приложение; URLconf
+        # (myproject.urls_public, wagtail.urls, home.api и представления)
+        # импортируется здесь, чтобы воркеры не делали это после fork
+        from django.urls import get_resolver
+        get_resolver().url_patterns
+
+        # robots.txt и страницы ошибок рендерятся один раз до fork
+        # (home/static_endpoints.py)
+        from home import static_endpoints
+        static_endpoints.render_all()
+
+        # Соединения с БД, открытые при предзагрузке, не должны
+        # достаться воркерам после fork
+        from django.db import connections
+        connections.close_all()
+
+    usage = memory_usage()
+    server.log.info("master ready: preload=%s rss=%d KiB", preload_app, usage["rss"])
+
+
+def pre_fork(server, worker):
+    worker.boot_started = time.monotonic()
+
+
+def worker_exit(server, worker):
+    # Несброшенная статистика поиска (search/analytics.py)
+    from search import analytics, index_queue
+    analytics.flush()
+    # Отложенные обновления поискового индекса (search/index_queue.py)
+    index_queue.drain()
+
+
+def post_worker_init(worker):
+    boot_ms = (time.monotonic() - worker.boot_started) * 1000
+    usage = memory_usage()
+    worker.log.info(
+        "worker %s booted in %.1f ms: rss=%d KiB private=%d KiB",
+        worker.pid, boot_ms, usage["rss"], usage["private"],
+    )
@@ -0,0 +1,215 @@
+# home/api.py
+"""
+JSON API только для чтения: города, услуги, практика и отзывы.
+
+GET /api/v1/<ресурс>/?fields=title,url&limit=20&cursor=...
+
+- fields — проекция: только перечисленные поля (по умолчанию все);
+- limit — размер страницы, не больше API_MAX_PAGE_SIZE;
+- cursor — непрозрачный курсор из "next" предыдущего ответа
+  (keyset по первичному ключу, без OFFSET).
+
+Каждый ответ — один запрос к БД при любом limit: адреса страниц берутся
+из снимка (home/snapshot.py), картинки — через select_related, оценки
+практики — агрегатом в том же запросе. Готовое тело хранится в кэше
+с ключом от поколения "pages" и отдаётся с ETag; после публикации
+ключ и ETag меняются. HTML-рендер страниц API не затрагивает.
+"""
+import hashlib
+import json
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Avg, Count, Q
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse, QueryDict
+from django.utils.html import strip_tags
+from django.views.decorators.http import require_GET
+
+from .cache import get_generation
+from .models import CityPage, ClientReview, LegalPracticePage, ServicePage
+from .reviews import InvalidCursor, decode_cursor, encode_cursor
+from .snapshot import get_snapshot
+
+Resource = namedtuple("Resource", "queryset fields descending")
+
+
+def text(value):
+    """RichText без разметки: expand_db_html ходил бы в БД за ссылками"""
+    return " ".join(strip_tags(value or "").split())
+
+
+def page_url(page):
+    summary = get_snapshot().get(page.id)
+    return summary.url if summary else ""
+
+
+def image_url(image):
+    return image.file.url if image else None
+
+
+PAGE_FIELDS = {
+    "id": lambda page: page.id,
+    "title": lambda page: page.title,
+    "url": page_url,
+    "last_published_at": lambda page: page.last_published_at,
+}
+
+ADDRESS_FIELDS = {
+    "hero_title": lambda page: page.hero_title,
+    "image": lambda page: image_url(page.hero_image),
+    "description": lambda page: text(page.description),
+    "street_address": lambda page: page.street_address,
+    "city": lambda page: page.city,
+    "region": lambda page: page.region,
+    "postal_code": lambda page: page.postal_code,
+    "phone": lambda page: page.phone,
+    "email": lambda page: page.email,
+}
+
+
+def live_pages(model):
+    return lambda: model.objects.live().public().select_related("hero_image")
+
+
+def practice_pages():
+    published = Q(client_reviews__is_published=True)
+    return LegalPracticePage.objects.live().public().annotate(
+        reviews_count=Count("client_reviews", filter=published),
+        rating=Avg("client_reviews__rating", filter=published),
+    )
+
+
+def published_reviews():
+    # Отзывы страниц с ограничением просмотра наружу не отдаются
+    return ClientReview.objects.filter(is_published=True, page__in=LegalPracticePage.objects.live().public())
+
+
+RESOURCES = {
+    "cities": Resource(live_pages(CityPage), dict(PAGE_FIELDS, **ADDRESS_FIELDS, city_name=lambda page: page.city_name), False),
+    "services": Resource(live_pages(ServicePage), dict(
+        PAGE_FIELDS, **ADDRESS_FIELDS,
+        price=lambda page: page.price,
+        price_description=lambda page: page.price_description,
+    ), False),
+    "practices": Resource(practice_pages, dict(
+        PAGE_FIELDS,
+        case_title=lambda page: page.case_title,
+        case_type=lambda page: page.case_type,
+        status=lambda page: page.status,
+        court=lambda page: page.court,
+        start_date=lambda page: page.start_date,
+        end_date=lambda page: page.end_date,
+        case_description=lambda page: text(page.case_description),
+        challenge=lambda page: text(page.challenge),
+        solution=lambda page: text(page.solution),
+        reviews_count=lambda page: page.reviews_count,
+        rating=lambda page: round(page.rating, 1) if page.rating else None,
+    ), False),
+    # Новые отзывы первыми
+    "reviews": Resource(published_reviews, {
+        "id": lambda review: review.id,
+        "practice": lambda review: review.page_id,
+        "client_name": lambda review: review.client_name,
+        "client_initials": lambda review: review.client_initials,
+        "title": lambda review: review.review_title,
+        "text": lambda review: text(review.review_text),
+        "rating": lambda review: review.rating,
+        "case_type": lambda review: review.case_type_review,
+        "date": lambda review: review.review_date,
+    }, True),
+}
+
+
+class ApiError(Exception):
+    pass
+
+
+def parse_params(request, resource):
+    fields = [name for name in request.GET.get("fields", "").split(",") if name]
+    unknown = [name for name in fields if name not in resource.fields]
+    if unknown:
+        raise ApiError("Неизвестные поля: {}".format(", ".join(unknown)))
+
+    try:
+        limit = int(request.GET.get("limit", settings.API_PAGE_SIZE))
+    except ValueError:
+        raise ApiError("limit должен быть числом")
+    limit = max(1, min(limit, settings.API_MAX_PAGE_SIZE))
+
+    after = None
+    cursor = request.GET.get("cursor")
+    if cursor:
+        try:
+            after = decode_cursor(cursor, int)[0]
+        except InvalidCursor:
+            raise ApiError("Неверный курсор")
+    return fields or list(resource.fields), limit, after
+
+
+def build_body(request, resource, fields, limit, after):
+    queryset = resource.queryset()
+    if resource.descending:
+        queryset = queryset.order_by("-pk")
+        if after is not None:
+            queryset = queryset.filter(pk__lt=after)
+    else:
+        queryset = queryset.order_by("pk")
+        if after is not None:
+            queryset = queryset.filter(pk__gt=after)
+
+    # Лишняя запись показывает, есть ли следующая страница
+    objects = list(queryset[:limit + 1])
+    has_next = len(objects) > limit
+    objects = objects[:limit]
+
+    next_url = None
+    if has_next:
+        # Только параметры API: тело кэшируется для всех клиентов
+        params = QueryDict(mutable=True)
+        if "fields" in request.GET:
+            params["fields"] = ",".join(fields)
+        params["limit"] = limit
+        params["cursor"] = encode_cursor(objects[-1].pk)
+        next_url = "{}?{}".format(request.path, params.urlencode(safe=","))
+
+    data = {
+        "results": [{field: resource.fields[field](obj) for field in fields} for obj in objects],
+        "next": next_url,
+    }
+    return json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False).encode("utf-8")
+
+
+def cache_key(name, fields, limit, after):
+    query = "{}:{}:{}".format(",".join(fields), limit, after)
+    return "api:{}:{}:{}".format(
+        get_generation("pages"), name, hashlib.md5(query.encode("utf-8")).hexdigest()
+    )
+
+
+@require_GET
+def resource_list(request, name):
+    resource = RESOURCES[name]
+    try:
+        fields, limit, after = parse_params(request, resource)
+    except ApiError as error:
+        return JsonResponse({"error": str(error)}, status=400)
+
+    key = cache_key(name, fields, limit, after)
+    entry = cache.get(key)
+    if entry is None:
+        body = build_body(request, resource, fields, limit, after)
+        entry = (body, '"{}"'.format(hashlib.md5(body).hexdigest()))
+        if settings.API_CACHE_TIMEOUT:
+            cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+
+    body, etag = entry
+    if etag in request.META.get("HTTP_IF_NONE_MATCH", ""):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = "public, max-age={}".format(settings.API_CLIENT_MAX_AGE)
+    response["Access-Control-Allow-Origin"] = "*"
+    return response
@@ -0,0 +1,75 @@
+# home/cache.py
+"""
+Поколения кэша.
+
+Поколение — число, которое входит в ключи кэшированных данных, поэтому
+смена поколения (например, при публикации страницы) разом делает
+устаревшими все такие ключи.
+
+Поколения хранятся в отдельных файлах (CACHE_GENERATIONS_DIR), а не
+в самом кэше: FileBasedCache при переполнении удаляет случайные записи,
+и сброшенный счётчик снова совпал бы с ключами старых страниц. Новое
+поколение — время в наносекундах, так что оно не повторяет ни одно из
+прежних, даже если файл потерян.
+
+Воркер перечитывает поколение не чаще раза в GENERATION_CHECK_INTERVAL
+секунд: горячий путь (кэш страниц, 404) не читает файл на каждый
+запрос. Свои изменения воркер видит сразу.
+"""
+import os
+import tempfile
+import time
+
+from django.conf import settings
+
+GENERATION_CHECK_INTERVAL = 1.0
+
+# имя -> (значение, когда проверено)
+_local = {}
+
+
+def generation_path(name):
+    return os.path.join(settings.CACHE_GENERATIONS_DIR, name)
+
+
+def write_generation(name, value):
+    """Атомарная запись: читатель видит либо старое, либо новое значение"""
+    os.makedirs(settings.CACHE_GENERATIONS_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=settings.CACHE_GENERATIONS_DIR, prefix=".{}.".format(name))
+    try:
+        with os.fdopen(fd, "w") as file:
+            file.write(str(value))
+        os.replace(tmp_path, generation_path(name))
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return value
+
+
+def read_generation(name):
+    try:
+        with open(generation_path(name)) as file:
+            return int(file.read())
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def get_generation(name):
+    now = time.monotonic()
+    entry = _local.get(name)
+    if entry is not None and now - entry[1] < GENERATION_CHECK_INTERVAL:
+        return entry[0]
+
+    value = read_generation(name)
+    if value is None:
+        value = write_generation(name, time.time_ns())
+    _local[name] = (value, now)
+    return value
+
+
+def bump_generation(name):
+    # Часы могли уйти назад: новое поколение всё равно больше текущего
+    value = max(time.time_ns(), (read_generation(name) or 0) + 1)
+    write_generation(name, value)
+    _local[name] = (value, time.monotonic())
+    return value
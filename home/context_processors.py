@@ -1,6 +0,0 @@
-from wagtail.models import Page
-
-def menu_pages(request):
-    return {
-        'menu_pages': Page.objects.live().public().in_menu()
-    }
\ No newline at end of file
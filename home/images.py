@@ -0,0 +1,174 @@
+# home/images.py
+"""
+Обработка загруженных изображений в фоне.
+
+Загрузка пишется во временный файл на диске (FILE_UPLOAD_HANDLERS), а не
+в память. После сохранения изображения пул потоков воркера
+(IMAGE_INGEST_WORKERS) приводит оригинал к виду, с которым дёшево
+работать дальше:
+- поворачивает по EXIF и удаляет метаданные (EXIF, XMP, комментарии);
+- уменьшает до IMAGE_INGEST_MAX_SIZE по большей стороне, фокусная
+  точка масштабируется вместе с картинкой;
+- заново генерирует ходовые рендишены (IMAGE_INGEST_RENDITIONS), уже с
+  конвертацией в WebP из WAGTAILIMAGES_FORMAT_CONVERSIONS, чтобы первый
+  посетитель не ждал декодирования оригинала.
+
+Pillow отпускает GIL при декодировании и кодировании, поэтому хватает
+потоков. Время декодирования, кодирования и рендишенов пишется в лог
+по каждому изображению. Повторная обработка уже приведённого оригинала
+ничего не перекодирует.
+"""
+import hashlib
+import io
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image as PILImage
+from PIL import ImageOps
+
+from .cache import bump_generation
+
+logger = logging.getLogger(__name__)
+
+# Форматы, которые перекодируем; анимированные GIF и прочее не трогаем
+SAVE_OPTIONS = {
+    "JPEG": lambda: {"quality": getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85), "optimize": True, "progressive": True},
+    "PNG": lambda: {"optimize": True},
+    "WEBP": lambda: {"quality": getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)},
+}
+METADATA_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment", "photoshop")
+
+IngestStats = namedtuple("IngestStats", "image_id decode_ms encode_ms renditions_ms size_before size_after rewritten resized")
+
+_lock = threading.Lock()
+_pool = None
+_pool_pid = None
+
+
+def get_pool():
+    """Пул потоков; после fork (preload в gunicorn) создаётся заново"""
+    global _pool, _pool_pid
+    with _lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ThreadPoolExecutor(max_workers=settings.IMAGE_INGEST_WORKERS, thread_name_prefix="image-ingest")
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def schedule(image_id):
+    """Обработка после коммита транзакции, в пуле воркера"""
+    transaction.on_commit(lambda: get_pool().submit(ingest_logged, image_id))
+
+
+def ingest_logged(image_id):
+    from django.db import connection
+
+    try:
+        ingest(image_id)
+    except Exception:
+        logger.exception("Не удалось обработать изображение %s", image_id)
+    finally:
+        connection.close()
+
+
+def needs_rewrite(original, max_size):
+    return max(original.size) > max_size or any(key in original.info for key in METADATA_KEYS) or (
+        original.getexif().get(0x0112, 1) != 1
+    )
+
+
+def rewrite(original, max_size):
+    """Поворот по EXIF, уменьшение, кодирование без метаданных; (bytes, размер, resized)"""
+    image = ImageOps.exif_transpose(original)
+    resized = max(image.size) > max_size
+    if resized:
+        image.thumbnail((max_size, max_size), PILImage.LANCZOS)
+
+    output = io.BytesIO()
+    options = SAVE_OPTIONS[original.format]()
+    icc_profile = original.info.get("icc_profile")
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    image.save(output, original.format, **options)
+    return output.getvalue(), image.size, resized
+
+
+def scale_focal_point(image, scale):
+    if image.focal_point_x is None:
+        return {}
+    return {
+        "focal_point_x": round(image.focal_point_x * scale),
+        "focal_point_y": round(image.focal_point_y * scale),
+        "focal_point_width": round(image.focal_point_width * scale),
+        "focal_point_height": round(image.focal_point_height * scale),
+    }
+
+
+def ingest(image_id):
+    """Приводит оригинал изображения к виду для хранения и готовит рендишены"""
+    from wagtail.images import get_image_model
+
+    model = get_image_model()
+    image = model.objects.filter(pk=image_id).first()
+    if image is None:
+        return None
+
+    path = image.file.path
+    size_before = os.path.getsize(path)
+    max_size = settings.IMAGE_INGEST_MAX_SIZE
+
+    started = time.perf_counter()
+    with PILImage.open(path) as original:
+        original.load()
+        decode_ms = (time.perf_counter() - started) * 1000
+
+        encode_ms = 0
+        rewritten = resized = False
+        animated = getattr(original, "is_animated", False)
+        if original.format in SAVE_OPTIONS and not animated and needs_rewrite(original, max_size):
+            started = time.perf_counter()
+            data, (width, height), resized = rewrite(original, max_size)
+            rewritten = True
+            encode_ms = (time.perf_counter() - started) * 1000
+
+            # Новое имя файла: имена рендишенов строятся от него, а они
+            # кэшируются браузерами и CDN (home/media.py)
+            old_name = image.file.name
+            changes = {
+                "file": image.file.storage.save(old_name, ContentFile(data)),
+                "width": width,
+                "height": height,
+                "file_size": len(data),
+                "file_hash": hashlib.sha1(data).hexdigest(),
+            }
+            if resized:
+                changes.update(scale_focal_point(image, width / image.width))
+            # update() без сигналов: иначе post_save снова поставит изображение в очередь
+            model.objects.filter(pk=image.pk).update(**changes)
+            image.refresh_from_db()
+            # Старые рендишены сделаны из прежнего оригинала
+            image.renditions.all().delete()
+            image.file.storage.delete(old_name)
+            # Кэшированный и готовый HTML полей ссылается на удалённые рендишены
+            bump_generation("pages")
+            bump_generation("prerender")
+
+    started = time.perf_counter()
+    for filter_spec in settings.IMAGE_INGEST_RENDITIONS:
+        image.get_rendition(filter_spec)
+    renditions_ms = (time.perf_counter() - started) * 1000
+
+    stats = IngestStats(image.pk, decode_ms, encode_ms, renditions_ms, size_before, image.file_size or size_before, rewritten, resized)
+    logger.info(
+        "Изображение %s: декодирование %.0f мс, кодирование %.0f мс, рендишены %.0f мс, %d -> %d байт%s",
+        stats.image_id, stats.decode_ms, stats.encode_ms, stats.renditions_ms,
+        stats.size_before, stats.size_after, ", уменьшено" if stats.resized else "",
+    )
+    return stats
@@ -0,0 +1,45 @@
+# home/management/commands/benchmark.py
+from django.core.management.base import BaseCommand
+
+from myproject.benchmarks import SUITES
+
+
+class Command(BaseCommand):
+    help = "Бенчмарки производительности (наборы — в myproject/benchmarks.py)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("suite", choices=sorted(SUITES))
+        parser.add_argument("--repeat", type=int, default=5, help="Число повторов замера")
+        parser.add_argument(
+            "--settings-module", action="append", default=[],
+            help="Профиль настроек для набора startup (можно указать несколько раз)",
+        )
+        parser.add_argument(
+            "--url", action="append", default=[],
+            help="Адрес запущенного сервера для набора load (можно указать несколько раз)",
+        )
+        parser.add_argument(
+            "--concurrency", action="append", type=int, default=[],
+            help="Число одновременных соединений для набора load",
+        )
+        parser.add_argument("--requests", type=int, default=500, help="Число запросов на замер в наборе load")
+        parser.add_argument(
+            "--path", action="append", default=[],
+            help="Путь страницы для наборов, работающих в процессе (можно указать несколько раз)",
+        )
+        parser.add_argument("--host", default="localhost", help="Заголовок Host для запросов в процессе")
+
+    def handle(self, *args, **options):
+        rows = SUITES[options["suite"]](options)
+        if not rows:
+            self.stdout.write("Нет результатов")
+            return
+
+        columns = list(rows[0])
+        widths = {
+            column: max(len(column), *(len(str(row.get(column, ""))) for row in rows))
+            for column in columns
+        }
+        self.stdout.write("  ".join(column.ljust(widths[column]) for column in columns))
+        for row in rows:
+            self.stdout.write("  ".join(str(row.get(column, "")).ljust(widths[column]) for column in columns))
@@ -0,0 +1,38 @@
+# home/management/commands/ingest_images.py
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from wagtail.images import get_image_model
+
+from home import images
+
+
+class Command(BaseCommand):
+    help = "Обрабатывает оригиналы изображений, загруженные до появления фоновой обработки (home/images.py)"
+
+    def handle(self, *args, **options):
+        count = rewritten = resized = decode_ms = encode_ms = before = after = 0
+        for image_id in get_image_model().objects.order_by("pk").values_list("pk", flat=True):
+            stats = images.ingest(image_id)
+            if stats is None:
+                continue
+            count += 1
+            rewritten += stats.rewritten
+            resized += stats.resized
+            decode_ms += stats.decode_ms
+            encode_ms += stats.encode_ms
+            before += stats.size_before
+            after += stats.size_after
+            self.stdout.write(
+                "#{}: декодирование {:.0f} мс, кодирование {:.0f} мс, рендишены {:.0f} мс, {} -> {} байт".format(
+                    stats.image_id, stats.decode_ms, stats.encode_ms, stats.renditions_ms,
+                    stats.size_before, stats.size_after,
+                )
+            )
+        self.stdout.write(
+            "Изображений: {}, уменьшено: {}, декодирование {:.0f} мс, кодирование {:.0f} мс, {} -> {} байт".format(
+                count, resized, decode_ms, encode_ms, before, after,
+            )
+        )
+        if rewritten:
+            # Заранее отрендеренный HTML ссылается на старые рендишены
+            call_command("prerender_pages", stdout=self.stdout)
@@ -0,0 +1,17 @@
+# home/management/commands/prerender_pages.py
+from django.core.management.base import BaseCommand
+from wagtail.models import Page
+
+from home.models import PrerenderMixin
+
+
+class Command(BaseCommand):
+    help = "Рендерит HTML полей всех опубликованных страниц (для страниц, опубликованных до появления PrerenderMixin)"
+
+    def handle(self, *args, **options):
+        count = 0
+        for page in Page.objects.live().specific():
+            if isinstance(page, PrerenderMixin):
+                page.prerender(page.live_revision_id)
+                count += 1
+        self.stdout.write(f"Отрендерено страниц: {count}")
@@ -0,0 +1,157 @@
+# home/media.py
+"""
+Отдача медиафайлов и документов.
+
+Если перед приложением стоит веб-сервер, передача файла отдаётся ему:
+MEDIA_ACCEL = "x-accel-redirect" (nginx, внутренний location
+MEDIA_ACCEL_PREFIX с alias на MEDIA_ROOT) или "x-sendfile" (Apache,
+lighttpd). Диапазоны и кэширование тогда тоже на веб-сервере.
+
+Без него файл отдаёт FileResponse: gunicorn передаёт его через
+wsgi.file_wrapper (sendfile), не копируя байты в Python. Запрос
+с Range получает 206 с одним диапазоном, условные запросы — 304.
+
+По MEDIA_URL отдаются только изображения (MEDIA_PUBLIC_DIRS): документы
+идут через serve_document с ограничениями коллекций wagtail.documents.
+Имена файлов Wagtail не содержат хэша содержимого, поэтому всё
+кэшируется на MEDIA_CACHE_MAX_AGE, без immutable.
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.http import http_date, parse_http_date_safe
+
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Оригиналы и рендишены изображений Wagtail в MEDIA_ROOT
+MEDIA_PUBLIC_DIRS = ("original_images/", "images/")
+
+
+def etag_for(stat):
+    return '"{:x}-{:x}"'.format(stat.st_size, int(stat.st_mtime))
+
+
+def not_modified(request, etag, mtime):
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        return etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*"
+    since = parse_http_date_safe(request.META.get("HTTP_IF_MODIFIED_SINCE", ""))
+    return since is not None and int(mtime) <= since
+
+
+def parse_range(request, etag, size):
+    """(start, end) включительно, None — весь файл, False — диапазон невыполним"""
+    header = request.META.get("HTTP_RANGE")
+    if not header or size == 0:
+        return None
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range and if_range.strip() != etag:
+        return None
+
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        # Несколько диапазонов и прочее не поддерживаем — отдаём файл целиком
+        return None
+    start, end = match.groups()
+    if not start:
+        if not end:
+            return None
+        length = min(int(end), size)
+        if length == 0:
+            return False
+        return size - length, size - 1
+    start = int(start)
+    if end and int(end) < start:
+        # Синтаксически неверный диапазон игнорируется (RFC 7233, 3.1)
+        return None
+    if start >= size:
+        return False
+    return start, min(int(end), size - 1) if end else size - 1
+
+
+def read_range(path, start, length):
+    with open(path, "rb") as file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def accel_response(path, content_type):
+    relative = os.path.relpath(path, settings.MEDIA_ROOT)
+    response = HttpResponse()
+    if settings.MEDIA_ACCEL == "x-accel-redirect":
+        response["X-Accel-Redirect"] = quote(settings.MEDIA_ACCEL_PREFIX + relative.replace(os.sep, "/"))
+    else:
+        response["X-Sendfile"] = path
+    if content_type:
+        response["Content-Type"] = content_type
+    else:
+        # Content-Type выставит веб-сервер по расширению
+        del response["Content-Type"]
+    return response
+
+
+def serve_file(request, path, cache_control, content_type=None, disposition=None):
+    """Ответ с файлом path из MEDIA_ROOT"""
+    try:
+        stat = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404
+    if not os.path.isfile(path):
+        raise Http404
+
+    if settings.MEDIA_ACCEL:
+        response = accel_response(path, content_type)
+    else:
+        etag = etag_for(stat)
+        if not_modified(request, etag, stat.st_mtime):
+            response = HttpResponseNotModified()
+            response["ETag"] = etag
+            response["Cache-Control"] = cache_control
+            return response
+
+        content_type = content_type or mimetypes.guess_type(path)[0] or "application/octet-stream"
+        byte_range = parse_range(request, etag, stat.st_size)
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = "bytes */{}".format(stat.st_size)
+            return response
+        if byte_range is None:
+            response = FileResponse(open(path, "rb"), content_type=content_type)
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                read_range(path, start, end - start + 1), status=206, content_type=content_type
+            )
+            response["Content-Length"] = end - start + 1
+            response["Content-Range"] = "bytes {}-{}/{}".format(start, end, stat.st_size)
+        response["Accept-Ranges"] = "bytes"
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(stat.st_mtime)
+
+    if disposition:
+        response["Content-Disposition"] = disposition
+    response["Cache-Control"] = cache_control
+    return response
+
+
+def serve_media(request, path):
+    """MEDIA_URL: оригиналы и рендишены изображений"""
+    if not path.startswith(MEDIA_PUBLIC_DIRS):
+        raise Http404
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404
+    return serve_file(request, full_path, "public, max-age={}".format(settings.MEDIA_CACHE_MAX_AGE))
@@ -0,0 +1,114 @@
+# home/middleware.py
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.utils.decorators import sync_and_async_middleware
+
+from . import not_found, page_cache, redirects, static_endpoints
+
+
+@sync_and_async_middleware
+def cached_page_middleware(get_response):
+    """
+    Быстрый путь для закэшированных страниц.
+
+    Стоит в начале MIDDLEWARE: при попадании в кэш ответ отдаётся без
+    сессий, авторизации, маршрутизации Wagtail и ORM. В режиме ASGI
+    файловый кэш читается в пуле потоков, а не в event loop; чтение
+    не привязано к общему sync-потоку (thread_sensitive=False).
+    """
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            if not page_cache.is_cacheable_request(request):
+                return await get_response(request)
+
+            response = await sync_to_async(page_cache.cached_response, thread_sensitive=False)(request)
+            if response is None:
+                response = await get_response(request)
+                if page_cache.is_cacheable_response(request, response):
+                    await sync_to_async(page_cache.store)(request, response)
+            return response
+    else:
+        def middleware(request):
+            if not page_cache.is_cacheable_request(request):
+                return get_response(request)
+
+            response = page_cache.cached_response(request)
+            if response is None:
+                response = get_response(request)
+                if page_cache.is_cacheable_response(request, response):
+                    page_cache.store(request, response)
+            return response
+
+    return middleware
+
+
+def resolve_not_found(request, response):
+    """Редирект из таблицы в памяти, иначе запоминаем путь как отсутствующий"""
+    if response.status_code != 404:
+        return response
+
+    redirect = redirects.redirect_response(request)
+    if redirect is not None:
+        return redirect
+
+    not_found.remember_missing(request)
+    return response
+
+
+@sync_and_async_middleware
+def not_found_middleware(get_response):
+    """
+    Редиректы и 404 без запросов к БД.
+
+    Стоит в начале MIDDLEWARE, после заголовков безопасности, и заменяет
+    RedirectMiddleware из wagtail.contrib.redirects: редиректы ищутся
+    в таблице в памяти (home/redirects.py), а повторные 404 отдаются
+    готовой страницей до сессий и всего, что ниже (home/not_found.py).
+    """
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            if not_found.is_known_missing(request):
+                # Первый рендер 404.html ходит в БД (wagtail_site)
+                return await sync_to_async(not_found.not_found_response)(request)
+
+            response = await get_response(request)
+            if response.status_code != 404:
+                return response
+            return await sync_to_async(resolve_not_found)(request, response)
+    else:
+        def middleware(request):
+            if not_found.is_known_missing(request):
+                return not_found.not_found_response(request)
+
+            return resolve_not_found(request, get_response(request))
+
+    return middleware
+
+
+@sync_and_async_middleware
+def static_endpoint_middleware(get_response):
+    """
+    robots.txt, файлы подтверждения и прочие статические ответы.
+
+    Стоит первым после заголовков безопасности: ответ уже готов байтами
+    (home/static_endpoints.py), поэтому не нужны ни маршрутизация,
+    ни сессии, ни контекстные процессоры.
+    """
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            endpoint = static_endpoints.for_path(request.path_info)
+            if endpoint is None or request.method not in ("GET", "HEAD"):
+                return await get_response(request)
+            if static_endpoints.is_rendered(endpoint, request.get_host()):
+                return static_endpoints.response(request, endpoint.name)
+            # Первый рендер шаблона может ходить в БД
+            return await sync_to_async(static_endpoints.response)(request, endpoint.name)
+    else:
+        def middleware(request):
+            endpoint = static_endpoints.for_path(request.path_info)
+            if endpoint is None or request.method not in ("GET", "HEAD"):
+                return get_response(request)
+            return static_endpoints.response(request, endpoint.name)
+
+    return middleware
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("wagtailcore", "0040_page_draft_title"),
+        ("home", "0003_contactspage_policypage_pricepage_uslugipage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PrerenderedField",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("field_name", models.CharField(max_length=100, verbose_name="Поле")),
+                ("revision_id", models.PositiveIntegerField(null=True, verbose_name="Ревизия")),
+                ("html", models.TextField(blank=True, verbose_name="HTML")),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Готовый HTML поля",
+                "verbose_name_plural": "Готовый HTML полей",
+                "unique_together": {("page", "field_name")},
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("home", "0004_prerenderedfield"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clientreview",
+            index=models.Index(fields=["is_published", "review_date"], name="home_review_pub_date_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="clientreview",
+            index=models.Index(fields=["page", "is_published", "review_date"], name="home_review_page_pub_date_idx"),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("home", "0005_clientreview_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="prerenderedfield",
+            name="generation",
+            field=models.BigIntegerField(null=True, verbose_name="Поколение ссылок"),
+        ),
+    ]
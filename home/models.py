@@ -1,15 +1,82 @@
 from django.db import models
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
 from wagtail.models import Page
 from wagtail import blocks
 from wagtail.fields import StreamField, RichTextField
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel, InlinePanel
 from wagtail.images.blocks import ImageChooserBlock
 from wagtail.search import index
+from wagtail.rich_text import expand_db_html
 from modelcluster.fields import ParentalKey
 from modelcluster.models import ClusterableModel
 
+from .cache import get_generation
+from .streaming import StreamingServeMixin
+
+
+class PrerenderMixin:
+    """
+    Поля страницы, HTML которых рендерится один раз при публикации.
+
+    prerendered_fields: имя поля -> шаблон для StreamField или None для
+    RichTextField (как |richtext). Готовый HTML хранится в PrerenderedField
+    вместе с id опубликованной ревизии, шаблоны берут его тегом
+    {% prerendered page "поле" %}.
+
+    В HTML уже подставлены адреса страниц и рендишенов. Их перемещение,
+    смена slug или замена изображения меняют поколение "prerender"
+    (home/signals.py), и устаревший HTML перерендеривается при первом
+    обращении.
+    """
+    prerendered_fields = {}
+
+    def render_field_html(self, field_name):
+        """Живой рендер поля (превью и страницы без сохранённого HTML)"""
+        template_name = self.prerendered_fields[field_name]
+        value = getattr(self, field_name)
+        if template_name:
+            return render_to_string(template_name, {"page": self, "value": value})
+        return expand_db_html(value) if value else ""
+
+    def prerender(self, revision_id):
+        """Рендерит и сохраняет HTML всех полей для опубликованной ревизии"""
+        generation = get_generation("prerender")
+        for field_name in self.prerendered_fields:
+            PrerenderedField.objects.update_or_create(
+                page_id=self.pk,
+                field_name=field_name,
+                defaults={
+                    "revision_id": revision_id,
+                    "generation": generation,
+                    "html": self.render_field_html(field_name),
+                },
+            )
+
+    def get_prerendered_html(self, field_name):
+        # Все поля страницы одним запросом, один раз на экземпляр
+        if not hasattr(self, "_prerendered"):
+            self._prerendered = {
+                item.field_name: item
+                for item in PrerenderedField.objects.filter(page_id=self.pk, revision_id=self.live_revision_id)
+            }
+
+        item = self._prerendered.get(field_name)
+        if item is None:
+            return mark_safe(self.render_field_html(field_name))
+
+        generation = get_generation("prerender")
+        if item.generation != generation:
+            # Ссылки или рендишены поменялись после рендера
+            item.html = self.render_field_html(field_name)
+            item.generation = generation
+            PrerenderedField.objects.filter(pk=item.pk, revision_id=item.revision_id).update(
+                html=item.html, generation=generation
+            )
+        return mark_safe(item.html)
+
 
-class HomePage(Page):
+class HomePage(PrerenderMixin, StreamingServeMixin, Page):
     """Главная страница сайта - Юрист по Крыму"""
     hero_title = models.CharField("Заголовок", max_length=255, blank=True, default="Юрист по Крыму")
     hero_image = models.ForeignKey(
@@ -41,6 +108,11 @@ class HomePage(Page):
 
     template = "home_page.html"
 
+    prerendered_fields = {
+        "description": None,
+        "content": "includes/content_blocks.html",
+    }
+
     # Настройки страницы
     parent_page_types = []  # Только в корне сайта
     subpage_types = ['CityPage', 'PracticeGalleryPage', 'ContactsPage', 'UslugiPage', 'PricePage', 'PolicyPage']
@@ -77,12 +149,6 @@ class HomePage(Page):
         index.SearchField('region'),
     ]
 
-    def get_context(self, request):
-        context = super().get_context(request)
-        # Добавляем все города в контекст главной страницы
-        context['cities'] = CityPage.objects.live().public()
-        return context
-
     def get_schema_org_data(self):
         """Генерация данных для Schema.org для главной страницы"""
         return {
@@ -108,7 +174,7 @@ class HomePage(Page):
         verbose_name_plural = "Главные страницы"
 
 
-class CityPage(Page):
+class CityPage(PrerenderMixin, StreamingServeMixin, Page):
     """Страница города - Юрист Симферополь"""
     city_name = models.CharField("Название услуги по городу", max_length=100, help_text="Например: Юрист Симферополь")
     
@@ -144,6 +210,11 @@ class CityPage(Page):
 
     template = "city_page.html"
 
+    prerendered_fields = {
+        "description": None,
+        "content": "includes/content_blocks.html",
+    }
+
     # Настройки страницы
     parent_page_types = ['HomePage']  # Можно создавать только в главной
     subpage_types = ['ServicePage']  # Можно создавать страницы услуг
@@ -181,12 +252,6 @@ class CityPage(Page):
         index.SearchField('region'),
     ]
 
-    def get_context(self, request):
-        context = super().get_context(request)
-        # Добавляем услуги этого города в контекст
-        context['services'] = ServicePage.objects.child_of(self).live()
-        return context
-
     def get_schema_org_data(self):
         """Генерация данных для Schema.org"""
         return {
@@ -212,7 +277,7 @@ class CityPage(Page):
         verbose_name_plural = "Страницы городов"
 
 
-class ServicePage(Page):
+class ServicePage(PrerenderMixin, StreamingServeMixin, Page):
     """Страница услуги - Семейный юрист Симферополь"""  
     
     # Герой секция для услуги
@@ -251,6 +316,11 @@ class ServicePage(Page):
 
     template = "service_page.html"
 
+    prerendered_fields = {
+        "description": None,
+        "content": "includes/content_blocks.html",
+    }
+
     # Настройки страницы
     parent_page_types = ['CityPage']  # Можно создавать только в странице города
     subpage_types = []  # Не может иметь дочерних страниц
@@ -514,8 +584,11 @@ class LegalPracticePage(Page):
     template = "legal_practice_page.html"
     
     def get_context(self, request):
+        from .reviews import reviews_page
+
         context = super().get_context(request)
-        context['reviews'] = self.client_reviews.all()
+        # Только опубликованные, первая страница; остальные — кнопкой "Ещё отзывы"
+        context['reviews'], context['reviews_next'] = reviews_page(page=self)
         return context
     
     class Meta:
@@ -576,4 +649,30 @@ class ClientReview(ClusterableModel):
     class Meta:
         verbose_name = "Отзыв клиента"
         verbose_name_plural = "Отзывы клиентов"
-        ordering = ['-review_date']
\ No newline at end of file
+        ordering = ['-review_date']
+        indexes = [
+            models.Index(fields=['is_published', 'review_date'], name='home_review_pub_date_idx'),
+            models.Index(fields=['page', 'is_published', 'review_date'], name='home_review_page_pub_date_idx'),
+        ]
+
+
+class PrerenderedField(models.Model):
+    """Готовый HTML поля страницы для опубликованной ревизии (см. PrerenderMixin)"""
+
+    page = models.ForeignKey(
+        'wagtailcore.Page',
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    field_name = models.CharField("Поле", max_length=100)
+    revision_id = models.PositiveIntegerField("Ревизия", null=True)
+    generation = models.BigIntegerField("Поколение ссылок", null=True)
+    html = models.TextField("HTML", blank=True)
+
+    def __str__(self):
+        return f"{self.page_id}.{self.field_name}@{self.revision_id}"
+
+    class Meta:
+        verbose_name = "Готовый HTML поля"
+        verbose_name_plural = "Готовый HTML полей"
+        unique_together = ('page', 'field_name')
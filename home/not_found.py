@@ -0,0 +1,71 @@
+# home/not_found.py
+"""
+Дешёвые 404 для сканирующих ботов.
+
+Пути, которые уже закончились 404 и не попали в редирект, запоминаются
+в ограниченном LRU (NOT_FOUND_CACHE_SIZE) и при повторе отдаются сразу,
+до сессий и маршрутизации. Тело страницы 404 рендерится один раз на
+поколение страниц и хранится вместе со сжатыми вариантами
+(home/static_endpoints.py). Запомненные пути сбрасываются при смене
+поколений "pages" или "redirects": путь мог появиться или получить
+редирект. Пути документов и медиафайлов (NOT_FOUND_SKIP_PREFIXES) не
+запоминаются: файл появляется при загрузке, поколения она не меняет.
+"""
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+from . import static_endpoints
+from .cache import get_generation
+
+_lock = threading.Lock()
+_generation = None
+_missing = OrderedDict()
+
+
+def generation():
+    return get_generation("pages"), get_generation("redirects")
+
+
+def check_generation():
+    """Сбрасывает запомненное, если страницы или редиректы поменялись"""
+    global _generation
+    current = generation()
+    if _generation != current:
+        with _lock:
+            _missing.clear()
+            _generation = current
+
+
+def path_key(request):
+    return request.get_host(), request.get_full_path()
+
+
+def is_known_missing(request):
+    if request.method not in ("GET", "HEAD"):
+        return False
+
+    check_generation()
+    key = path_key(request)
+    with _lock:
+        if key not in _missing:
+            return False
+        _missing.move_to_end(key)
+    return True
+
+
+def remember_missing(request):
+    if request.method not in ("GET", "HEAD") or request.path.startswith(tuple(settings.NOT_FOUND_SKIP_PREFIXES)):
+        return
+
+    key = path_key(request)
+    with _lock:
+        _missing[key] = True
+        _missing.move_to_end(key)
+        while len(_missing) > settings.NOT_FOUND_CACHE_SIZE:
+            _missing.popitem(last=False)
+
+
+def not_found_response(request):
+    return static_endpoints.response(request, "404")
@@ -0,0 +1,192 @@
+# home/optimize.py
+"""
+Оптимизация HTML перед записью в кэш страниц (home/page_cache.py).
+
+Выполняется один раз на закэшированный рендер, по шагам:
+- jsonld: все блоки application/ld+json страницы сводятся в один @graph;
+  вложенные объекты со своим @type, повторяющиеся на странице (адрес,
+  организация, человек), выносятся в граф один раз и заменяются ссылкой
+  {"@id": ...};
+- sprites: одинаковые inline-SVG, встречающиеся больше одного раза,
+  становятся <symbol> в скрытом спрайте в начале <body>, а на местах
+  остаётся <svg><use href="#..."/></svg> со своими атрибутами;
+- minify: удаляются HTML-комментарии и схлопываются пробелы вне
+  <pre>, <textarea>, <script> и <style>.
+
+optimize_html возвращает HTML и экономию в байтах по шагам; сводку по
+типам страниц печатает python manage.py benchmark optimize.
+"""
+import json
+import re
+from collections import Counter
+
+JSONLD_RE = re.compile(r'<script type="application/ld\+json">(.*?)</script>\s*', re.S | re.I)
+SVG_RE = re.compile(r"<svg\b([^>]*)>(.*?)</svg>", re.S | re.I)
+VIEWBOX_RE = re.compile(r'\s*viewBox="([^"]*)"', re.I)
+BODY_RE = re.compile(r"<body\b[^>]*>", re.I)
+PROTECTED_RE = re.compile(r"(<(pre|textarea|script|style)\b.*?</\2\s*>)", re.S | re.I)
+COMMENT_RE = re.compile(r"<!--(?!\[if|<!|>).*?-->", re.S)
+SPACE_RE = re.compile(r"\s+")
+
+SPRITE_PREFIX = "svg-sprite-"
+
+
+def size(html):
+    return len(html.encode("utf-8"))
+
+
+# JSON-LD
+
+def jsonld_key(value):
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def node_type(value):
+    node = value.get("@type", "thing")
+    return (node[0] if isinstance(node, list) else node).lower()
+
+
+def consolidate(nodes, base_url):
+    """Один граф без повторяющихся вложенных объектов"""
+    counts = Counter()
+
+    def count(value, top):
+        if isinstance(value, dict):
+            if not top and "@type" in value and "@id" not in value:
+                counts[jsonld_key(value)] += 1
+            for item in value.values():
+                count(item, False)
+        elif isinstance(value, list):
+            for item in value:
+                count(item, False)
+
+    for node in nodes:
+        count(node, True)
+
+    graph = []
+    ids = {}
+
+    def hoist(value):
+        key = jsonld_key(value)
+        if key not in ids:
+            ids[key] = "{}#{}-{}".format(base_url, node_type(value), len(ids) + 1)
+            graph.append(dict(replace(value, True), **{"@id": ids[key]}))
+        return {"@id": ids[key]}
+
+    def replace(value, top):
+        if isinstance(value, dict):
+            if not top and counts[jsonld_key(value)] > 1:
+                return hoist(value)
+            return {name: replace(item, False) for name, item in value.items()}
+        if isinstance(value, list):
+            return [replace(item, False) for item in value]
+        return value
+
+    seen = set()
+    for node in nodes:
+        key = jsonld_key(node)
+        if key not in seen:
+            seen.add(key)
+            graph.append(replace(node, True))
+    return graph
+
+
+def merge_jsonld(html, base_url):
+    nodes = []
+    parsed = []
+    for match in JSONLD_RE.finditer(html):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            # Блок с ошибкой в шаблоне оставляем как есть
+            continue
+        parsed.append(match)
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict):
+                item.pop("@context", None)
+                nodes.extend(item["@graph"] if "@graph" in item else [item])
+    if not parsed:
+        return html
+
+    graph = {"@context": "https://schema.org", "@graph": consolidate(nodes, base_url)}
+    script = '<script type="application/ld+json">{}</script>'.format(
+        json.dumps(graph, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+    )
+    parts = []
+    position = 0
+    for number, match in enumerate(parsed):
+        parts.append(html[position:match.start()])
+        if number == 0:
+            parts.append(script)
+        position = match.end()
+    parts.append(html[position:])
+    return "".join(parts)
+
+
+# SVG
+
+def build_sprites(html):
+    matches = list(SVG_RE.finditer(html))
+    shapes = Counter()
+    for match in matches:
+        viewbox = VIEWBOX_RE.search(match.group(1))
+        shapes[(viewbox.group(1) if viewbox else "", match.group(2).strip())] += 1
+
+    symbols = {}
+    for shape, number in shapes.items():
+        if number > 1:
+            symbols[shape] = "{}{}".format(SPRITE_PREFIX, len(symbols) + 1)
+    body = BODY_RE.search(html)
+    if not symbols or body is None:
+        return html
+
+    def use(match):
+        viewbox = VIEWBOX_RE.search(match.group(1))
+        symbol_id = symbols.get((viewbox.group(1) if viewbox else "", match.group(2).strip()))
+        if symbol_id is None:
+            return match.group(0)
+        return '<svg{}><use href="#{}"/></svg>'.format(VIEWBOX_RE.sub("", match.group(1)), symbol_id)
+
+    sprite = '<svg xmlns="http://www.w3.org/2000/svg" style="display:none">{}</svg>'.format("".join(
+        '<symbol id="{}"{}>{}</symbol>'.format(symbol_id, ' viewBox="{}"'.format(viewbox) if viewbox else "", inner)
+        for (viewbox, inner), symbol_id in symbols.items()
+    ))
+    optimized = SVG_RE.sub(use, html)
+    body = BODY_RE.search(optimized)
+    optimized = optimized[:body.end()] + sprite + optimized[body.end():]
+    # Пара мелких иконок в спрайте может выйти длиннее, чем inline
+    return optimized if len(optimized) < len(html) else html
+
+
+# Пробелы и комментарии
+
+def minify(html):
+    parts = []
+    position = 0
+    for match in PROTECTED_RE.finditer(html):
+        parts.append(collapse(html[position:match.start()]))
+        parts.append(match.group(1))
+        position = match.end()
+    parts.append(collapse(html[position:]))
+    return "".join(parts).strip()
+
+
+def collapse(fragment):
+    return SPACE_RE.sub(" ", COMMENT_RE.sub("", fragment))
+
+
+STEPS = (
+    ("jsonld", merge_jsonld),
+    ("sprites", lambda html, base_url: build_sprites(html)),
+    ("minify", lambda html, base_url: minify(html)),
+)
+
+
+def optimize_html(html, base_url):
+    """(HTML, {шаг: сэкономлено байт})"""
+    savings = {}
+    for name, step in STEPS:
+        before = size(html)
+        html = step(html, base_url)
+        savings[name] = before - size(html)
+    return html, savings
@@ -0,0 +1,109 @@
+# home/page_cache.py
+"""
+Кэш готового HTML страниц для анонимных посетителей.
+
+Ключ — схема, хост и путь запроса плюс поколение "pages", которое
+увеличивается при любой публикации (см. home/signals.py). Страница
+попадает в кэш только если Wagtail отметил её как публичную
+(хук before_serve_page в home/wagtail_hooks.py). Вместе с телом
+хранятся заголовки ответа (кроме длины и cookies), попадание отдаётся
+с ними же.
+"""
+import hashlib
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+from .cache import get_generation
+from .optimize import optimize_html
+
+logger = logging.getLogger(__name__)
+
+
+def is_enabled():
+    return getattr(settings, "PAGE_CACHE_TIMEOUT", 0) > 0
+
+
+def is_cacheable_request(request):
+    """GET без параметров от посетителя без сессии (редакторы видят живые страницы)"""
+    return (
+        is_enabled()
+        and request.method in ("GET", "HEAD")
+        and not request.META.get("QUERY_STRING")
+        and settings.SESSION_COOKIE_NAME not in request.COOKIES
+    )
+
+
+def is_cacheable_response(request, response):
+    return (
+        getattr(request, "is_cacheable_page", False)
+        and response.status_code == 200
+        and not response.cookies
+        and "private" not in response.get("Cache-Control", "")
+    )
+
+
+def cache_key(request):
+    url = "{}://{}{}".format(request.scheme, request.get_host(), request.path)
+    return "page-response:{}:{}".format(
+        get_generation("pages"),
+        hashlib.md5(url.encode("utf-8")).hexdigest(),
+    )
+
+
+def cached_response(request):
+    """Ответ из кэша или None"""
+    entry = cache.get(cache_key(request))
+    if entry is None:
+        return None
+
+    headers, content = entry
+    response = HttpResponse(content)
+    for name, value in headers:
+        response[name] = value
+    response["Content-Length"] = len(content)
+    response["X-Page-Cache"] = "hit"
+    return response
+
+
+def stored_headers(response):
+    # Длина пересчитывается, cookies в кэшируемых ответах не бывает
+    return [(name, value) for name, value in response.items() if name.lower() not in ("content-length", "set-cookie")]
+
+
+def optimize(request, content_type, content):
+    """HTML сжимается один раз перед записью в кэш (home/optimize.py)"""
+    if not settings.PAGE_OPTIMIZE_HTML or not content_type.startswith("text/html"):
+        return content
+    html, savings = optimize_html(content.decode(response_charset(content_type)), request.build_absolute_uri(request.path))
+    logger.debug("HTML %s: сэкономлено %s", request.path, savings)
+    return html.encode(response_charset(content_type))
+
+
+def response_charset(content_type):
+    _, _, charset = content_type.partition("charset=")
+    return charset.strip() or settings.DEFAULT_CHARSET
+
+
+def store(request, response):
+    """Кладёт ответ в кэш; потоковый — после того, как он отдан клиенту целиком"""
+    key = cache_key(request)
+    content_type = response["Content-Type"]
+    if not response.streaming:
+        response.content = optimize(request, content_type, response.content)
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = len(response.content)
+        cache.set(key, (stored_headers(response), response.content), settings.PAGE_CACHE_TIMEOUT)
+        return
+
+    def tee(chunks):
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        content = optimize(request, content_type, b"".join(parts))
+        cache.set(key, (stored_headers(response), content), settings.PAGE_CACHE_TIMEOUT)
+
+    response.streaming_content = tee(response.streaming_content)
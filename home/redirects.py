@@ -0,0 +1,89 @@
+# home/redirects.py
+"""
+Таблица редиректов в памяти воркера.
+
+Заменяет wagtail.contrib.redirects.middleware.RedirectMiddleware: вместо
+запроса к wagtailredirects_redirect на каждый 404 — поиск в словаре.
+Таблица собирается целиком при первом обращении и пересобирается, когда
+меняется поколение "redirects" (сохранение/удаление редиректа) или
+"pages" (ссылки на страницы зависят от их адресов), см. home/signals.py.
+"""
+import threading
+from urllib.parse import urlparse
+
+from django.http import HttpResponsePermanentRedirect, HttpResponseRedirect
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+from .cache import get_generation
+
+_lock = threading.Lock()
+
+# (поколение, {(site_id, old_path): (link, is_permanent)})
+_table = (None, {})
+
+
+def generation():
+    return get_generation("redirects"), get_generation("pages")
+
+
+def redirect_link(redirect):
+    """
+    Redirect.link без redirect_page.specific: тот делает запрос на каждую
+    страницу, а адрес у базовой Page тот же (get_url_parts в проекте
+    не переопределяется). Путь внутри RoutablePage проверяет только link.
+    """
+    if redirect.redirect_page is None:
+        return redirect.redirect_link or None
+    if redirect.redirect_page_route_path:
+        return redirect.link
+    return redirect.redirect_page.url
+
+
+def build():
+    table = {}
+    for redirect in Redirect.objects.select_related("redirect_page"):
+        link = redirect_link(redirect)
+        if link is not None:
+            table[(redirect.site_id, redirect.old_path)] = (link, redirect.is_permanent)
+    return table
+
+
+def get_table():
+    global _table
+    current = generation()
+    if _table[0] != current:
+        with _lock:
+            if _table[0] != current:
+                _table = (current, build())
+    return _table[1]
+
+
+def find(site_id, path):
+    """(link, is_permanent) для пути; редирект сайта важнее общего"""
+    table = get_table()
+    return table.get((site_id, path)) or table.get((None, path))
+
+
+def redirect_response(request):
+    """Ответ-редирект для запроса, закончившегося 404, или None"""
+    if not get_table():
+        return None
+
+    site = Site.find_for_request(request)
+    site_id = site.id if site else None
+
+    # Как в RedirectMiddleware: сначала путь с параметрами, потом без
+    path = Redirect.normalise_path(request.get_full_path())
+    found = find(site_id, path)
+    if found is None:
+        path_without_query = urlparse(path).path
+        if path_without_query != path:
+            found = find(site_id, path_without_query)
+    if found is None:
+        return None
+
+    link, is_permanent = found
+    if is_permanent:
+        return HttpResponsePermanentRedirect(link)
+    return HttpResponseRedirect(link)
@@ -0,0 +1,87 @@
+# home/reviews.py
+"""
+Выборки опубликованных отзывов ClientReview.
+
+Отзывы идут от новых к старым, по (review_date, id), и листаются
+keyset-курсором: следующая страница начинается после последнего
+показанного отзыва, без OFFSET и без загрузки всех строк. Запросы
+покрываются составными индексами (is_published, review_date) и
+(page, is_published, review_date), см. миграцию 0005.
+"""
+import base64
+import binascii
+import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Avg, Count, Q
+
+from .cache import get_generation
+from .models import ClientReview
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def published(page=None):
+    queryset = ClientReview.objects.filter(is_published=True)
+    if page is not None:
+        queryset = queryset.filter(page=page)
+    return queryset.order_by("-review_date", "-id")
+
+
+def encode_cursor(*values):
+    """Непрозрачный курсор из значений ключа сортировки (он же в home/api.py)"""
+    value = ":".join(str(item) for item in values)
+    return base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, *parsers):
+    """Значения курсора, каждое через свой parser; InvalidCursor, если курсор испорчен"""
+    try:
+        values = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":")
+        if len(values) != len(parsers):
+            raise ValueError(cursor)
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor)
+
+
+def normalize_cursor(cursor):
+    """
+    Курсор в каноническом виде (для ключей кэша): base64 и разбор
+    значений допускают разные записи одного и того же курсора
+    """
+    if not cursor:
+        return ""
+    return encode_cursor(*decode_cursor(cursor, datetime.date.fromisoformat, int))
+
+
+def reviews_page(page=None, cursor=None, limit=None):
+    """(отзывы, курсор следующей страницы или None)"""
+    limit = limit or settings.REVIEWS_PAGE_SIZE
+    queryset = published(page)
+    if cursor:
+        review_date, review_id = decode_cursor(cursor, datetime.date.fromisoformat, int)
+        queryset = queryset.filter(
+            Q(review_date__lt=review_date) | Q(review_date=review_date, id__lt=review_id)
+        )
+
+    # Лишняя запись показывает, есть ли следующая страница
+    reviews = list(queryset[:limit + 1])
+    if len(reviews) > limit:
+        last = reviews[limit - 1]
+        return reviews[:limit], encode_cursor(last.review_date.isoformat(), last.id)
+    return reviews, None
+
+
+def summary():
+    """Средняя оценка и число опубликованных отзывов; пересчитывается после публикации"""
+    key = "review-summary:{}".format(get_generation("pages"))
+    result = cache.get(key)
+    if result is None:
+        result = ClientReview.objects.filter(is_published=True).aggregate(average=Avg("rating"), count=Count("id"))
+        result["average"] = round(result["average"] or 0, 1)
+        cache.set(key, result, settings.PAGE_CACHE_TIMEOUT)
+    return result
@@ -0,0 +1,53 @@
+# home/routing.py
+"""
+Кэш маршрутов страниц.
+
+Page.route() спускается по дереву, один запрос на сегмент пути. Кэш
+хранит в словаре воркера (site_id, путь) -> (id страницы, id типа,
+url_path), и повторный запрос стоит одной выборки страницы по первичному
+ключу. Найденная страница проверяется (live и тот же url_path), поэтому
+устаревшая запись просто отбрасывается и маршрут строится заново.
+При публикации, снятии с публикации и перемещении страницы её записи
+и записи поддерева удаляются сразу (home/signals.py).
+"""
+import threading
+
+from django.contrib.contenttypes.models import ContentType
+
+_lock = threading.Lock()
+
+# (site_id, путь) -> (page_id, content_type_id, url_path)
+_routes = {}
+
+
+def route_key(site, path_components):
+    return site.id, "/".join(path_components)
+
+
+def cached_page(site, path_components):
+    """Конкретная (specific) страница по кэшу или None"""
+    key = route_key(site, path_components)
+    entry = _routes.get(key)
+    if entry is None:
+        return None
+
+    page_id, content_type_id, url_path = entry
+    model = ContentType.objects.get_for_id(content_type_id).model_class()
+    page = model.objects.filter(pk=page_id, live=True).first() if model else None
+    if page is None or page.url_path != url_path:
+        _routes.pop(key, None)
+        return None
+    return page
+
+
+def remember(site, path_components, page):
+    with _lock:
+        _routes[route_key(site, path_components)] = (page.id, page.content_type_id, page.url_path)
+
+
+def forget(page_id, url_path=None):
+    """Удаляет записи страницы и всего поддерева с url_path"""
+    with _lock:
+        for key, (cached_id, _, cached_path) in list(_routes.items()):
+            if cached_id == page_id or (url_path and cached_path.startswith(url_path)):
+                del _routes[key]
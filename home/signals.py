@@ -0,0 +1,79 @@
+# home/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.images import get_image_model
+from wagtail.models import Page
+from wagtail.signals import page_published, page_slug_changed, page_unpublished, post_page_move
+
+from . import images, routing, snapshot
+from .cache import bump_generation
+from .models import PrerenderMixin
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def invalidate_pages(sender, **kwargs):
+    """Публикация меняет меню, ссылки и отзывы на многих страницах — сбрасываем кэш страниц целиком"""
+    bump_generation("pages")
+
+
+@receiver(post_save, sender=Redirect)
+@receiver(post_delete, sender=Redirect)
+def invalidate_redirects(sender, **kwargs):
+    """Таблица редиректов в памяти воркеров (home/redirects.py) пересоберётся"""
+    bump_generation("redirects")
+
+
+@receiver(page_published)
+def prerender_page(sender, instance, revision=None, **kwargs):
+    """Рендерим StreamField и RichText опубликованной ревизии один раз, а не на каждый запрос"""
+    if isinstance(instance, PrerenderMixin):
+        instance.prerender(revision.id if revision else instance.live_revision_id)
+
+
+@receiver(post_page_move)
+@receiver(page_slug_changed)
+@receiver(post_delete, sender=Page)
+@receiver(post_save, sender=get_image_model())
+@receiver(post_delete, sender=get_image_model())
+def invalidate_prerendered(sender, **kwargs):
+    """Готовый HTML полей ссылается на адреса страниц и рендишены — перерендерится при обращении"""
+    bump_generation("prerender")
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+def forget_routes(sender, instance, **kwargs):
+    """Маршруты страницы и её поддерева в кэше этого воркера (home/routing.py)"""
+    routing.forget(instance.id, instance.url_path)
+
+
+@receiver(post_page_move)
+def forget_moved_routes(sender, instance, url_path_before=None, **kwargs):
+    """После перемещения старые адреса поддерева больше не ведут на страницы"""
+    routing.forget(instance.id, url_path_before)
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_page_move)
+def rebuild_snapshot(sender, **kwargs):
+    """Снимок сводки страниц собирается один раз на публикацию, а не в каждом воркере"""
+    snapshot.schedule_write()
+
+
+@receiver(post_delete, sender=Page)
+def page_deleted(sender, instance, **kwargs):
+    """Удалённая страница пропадает из кэша страниц и снимка"""
+    bump_generation("pages")
+    snapshot.schedule_write()
+
+
+@receiver(post_save, sender=get_image_model())
+def ingest_image(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
+    """Новый или заменённый оригинал обрабатывается в фоне (home/images.py)"""
+    if raw or (update_fields is not None and "file" not in update_fields):
+        return
+    images.schedule(instance.pk)
@@ -0,0 +1,208 @@
+# home/snapshot.py
+"""
+Снимок сводки опубликованных страниц в общем для воркеров файле.
+
+Меню и адреса страниц (home/templatetags/custom_menu.py, home/api.py)
+нужны на каждом запросе. Вместо того чтобы каждый воркер выбирал их из
+БД сам, снимок собирается один раз на транзакцию с публикацией
+(home/signals.py) в компактный двоичный файл, а воркеры отображают его
+в память только для чтения (mmap): страницы памяти общие для всех
+процессов. Новый снимок записывается во временный файл и подменяет
+старый через os.replace, воркер замечает подмену по os.stat и
+переоткрывает файл; файл другого формата пересобирается.
+
+Формат (little-endian):
+    HEADER      магия, число записей, смещение индекса, смещение строк
+    RECORD * n  id, parent_id, depth, in_menu и (смещение, длина) каждого
+                поля из STRING_FIELDS; записи в порядке дерева (по path)
+    INDEX * n   (id, номер записи), по возрастанию id
+    строки      UTF-8 подряд
+"""
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import transaction
+
+MAGIC = b"CYSNAP02"
+HEADER = struct.Struct("<8sIII")
+STRING_FIELDS = ("path", "url", "title")
+RECORD = struct.Struct("<IIHB" + "II" * len(STRING_FIELDS))
+INDEX = struct.Struct("<II")
+
+PageSummary = namedtuple("PageSummary", ("id", "parent_id", "depth", "in_menu") + STRING_FIELDS)
+
+
+# Сборка
+
+def summarize_page(page, parent_id):
+    return PageSummary(
+        id=page.id,
+        parent_id=parent_id,
+        depth=page.depth,
+        in_menu=page.show_in_menus,
+        path=page.path,
+        url=page.url or "",
+        title=page.title,
+    )
+
+
+def collect():
+    """Сводки всех опубликованных публичных страниц в порядке дерева"""
+    from wagtail.models import Page
+
+    ids_by_path = {}
+    summaries = []
+    for page in Page.objects.live().public().filter(depth__gt=1).order_by("path"):
+        ids_by_path[page.path] = page.id
+        parent_id = ids_by_path.get(page.path[:-Page.steplen], 0)
+        summaries.append(summarize_page(page, parent_id))
+    return summaries
+
+
+def encode(summaries):
+    records = bytearray()
+    strings = bytearray()
+    for summary in summaries:
+        refs = []
+        for field in STRING_FIELDS:
+            data = (getattr(summary, field) or "").encode("utf-8")
+            refs += [len(strings), len(data)]
+            strings += data
+        records += RECORD.pack(summary.id, summary.parent_id, summary.depth, summary.in_menu, *refs)
+
+    index = b"".join(
+        INDEX.pack(page_id, number)
+        for page_id, number in sorted((summary.id, number) for number, summary in enumerate(summaries))
+    )
+
+    index_offset = HEADER.size + len(records)
+    strings_offset = index_offset + len(index)
+    header = HEADER.pack(MAGIC, len(summaries), index_offset, strings_offset)
+    return header + bytes(records) + index + bytes(strings)
+
+
+def write(path=None):
+    """Собирает снимок и атомарно подменяет файл PAGE_SNAPSHOT_PATH"""
+    path = path or settings.PAGE_SNAPSHOT_PATH
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    data = encode(collect())
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+_scheduled = threading.local()
+
+
+def schedule_write():
+    """
+    Пересборка после коммита, одна на транзакцию: удаление или снятие
+    с публикации поддерева присылает сигнал на каждую страницу.
+    """
+    _scheduled.pending = True
+    transaction.on_commit(write_pending)
+
+
+def write_pending():
+    # Первый колбэк транзакции собирает снимок, остальные ничего не делают
+    if getattr(_scheduled, "pending", False):
+        _scheduled.pending = False
+        write()
+
+
+# Чтение
+
+class Snapshot:
+    """Снимок, отображённый в память; записи декодируются при обращении"""
+
+    def __init__(self, path):
+        with open(path, "rb") as snapshot_file:
+            self.stat = os.fstat(snapshot_file.fileno())
+            self.buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.count, self.index_offset, self.strings_offset = HEADER.unpack_from(self.buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Неизвестный формат снимка страниц: {}".format(path))
+
+    def is_current(self, stat):
+        return (stat.st_ino, stat.st_mtime_ns) == (self.stat.st_ino, self.stat.st_mtime_ns)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for number in range(self.count):
+            yield self.record(number)
+
+    def record(self, number):
+        values = RECORD.unpack_from(self.buffer, HEADER.size + number * RECORD.size)
+        strings = []
+        for i in range(4, len(values), 2):
+            start = self.strings_offset + values[i]
+            strings.append(self.buffer[start:start + values[i + 1]].decode("utf-8"))
+        return PageSummary(values[0], values[1], values[2], bool(values[3]), *strings)
+
+    def get(self, page_id):
+        """Сводка страницы по id (двоичный поиск по индексу) или None"""
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            found_id, number = INDEX.unpack_from(self.buffer, self.index_offset + middle * INDEX.size)
+            if found_id == page_id:
+                return self.record(number)
+            if found_id < page_id:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def children(self, page_id, in_menu=None):
+        return [
+            summary for summary in self
+            if summary.parent_id == page_id and (in_menu is None or summary.in_menu == in_menu)
+        ]
+
+    def menu_pages(self, depth=None):
+        return [
+            summary for summary in self
+            if summary.in_menu and (depth is None or summary.depth == depth)
+        ]
+
+
+_lock = threading.Lock()
+_current = None
+
+
+def get_snapshot():
+    """Текущий снимок; собирается при первом обращении, переоткрывается после подмены"""
+    global _current
+    path = settings.PAGE_SNAPSHOT_PATH
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        write(path)
+        stat = os.stat(path)
+
+    if _current is None or not _current.is_current(stat):
+        with _lock:
+            if _current is None or not _current.is_current(stat):
+                try:
+                    _current = Snapshot(path)
+                except ValueError:
+                    # Снимок прежней версии формата
+                    write(path)
+                    _current = Snapshot(path)
+    return _current
@@ -0,0 +1,183 @@
+# home/static_endpoints.py
+"""
+Статические ответы: robots.txt, страницы 500 и 404, файлы подтверждения
+владения сайтом.
+
+Ответы объявляются в STATIC_ENDPOINTS и SITE_VERIFICATION_FILES,
+рендерятся один раз (при старте в gunicorn.conf.py или при первом
+обращении) и хранятся байтами вместе с ETag и сжатыми вариантами
+(gzip, brotli — если установлен). Ответы с путём отдаёт
+static_endpoint_middleware до маршрутизации, сессий и авторизации;
+страницы ошибок берут custom_500 и home/not_found.py.
+
+Шаблоны рендерятся отдельно для каждого хоста (сайта Wagtail) запроса
+с путём, который не совпадает ни с одним пунктом меню; шаблоны с меню
+и ссылками на страницы (pages=True) перерендериваются после смены
+поколения "pages".
+"""
+import gzip
+import hashlib
+import threading
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
+from django.template.loader import render_to_string
+from django.utils.cache import patch_vary_headers
+
+from .cache import get_generation
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+Rendered = namedtuple("Rendered", "body etag variants generation")
+
+
+class StaticEndpoint:
+    def __init__(self, name, path=None, template=None, content=None,
+                 content_type="text/html; charset=utf-8", status=200, max_age=60 * 60, pages=False):
+        self.name = name
+        self.path = path
+        self.template = template
+        self.content = content
+        self.content_type = content_type
+        self.status = status
+        self.max_age = max_age
+        self.pages = pages
+
+    def render(self, host):
+        if self.content is not None:
+            return self.content.encode("utf-8")
+        return render_to_string(self.template, request=self.render_request(host)).encode("utf-8")
+
+    def render_request(self, host):
+        """
+        Запрос к хосту для шаблонов, которым нужен request: по хосту
+        wagtail_site находит сайт. Путь страницы ошибки не совпадает
+        ни с одним пунктом меню, так что активного пункта нет.
+        """
+        request = HttpRequest()
+        request.method = "GET"
+        request.path = request.path_info = self.path or "/{}".format(self.name)
+        hostname, _, port = host.partition(":")
+        request.META = {
+            "SERVER_NAME": hostname,
+            "SERVER_PORT": port or "443",
+            "HTTP_HOST": host,
+            "wsgi.url_scheme": "https",
+        }
+        return request
+
+    def host_key(self, host):
+        # Текст без шаблона от хоста не зависит
+        return host if self.content is None else None
+
+
+def default_host():
+    return urlsplit(settings.WAGTAILADMIN_BASE_URL).netloc or "localhost"
+
+
+def compress(body):
+    variants = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(body)
+    # Сжатие мелкого файла может выйти длиннее оригинала
+    return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+
+def load_endpoints():
+    endpoints = [StaticEndpoint(**options) for options in settings.STATIC_ENDPOINTS]
+    endpoints += [
+        StaticEndpoint(name=filename, path="/" + filename, content=content)
+        for filename, content in settings.SITE_VERIFICATION_FILES.items()
+    ]
+    return {endpoint.name: endpoint for endpoint in endpoints}
+
+
+# Хостов в ALLOWED_HOSTS немного; ограничение на случай ALLOWED_HOSTS = ["*"]
+MAX_HOSTS = 16
+
+_lock = threading.Lock()
+_endpoints = None
+_by_path = None
+# (имя, хост) -> Rendered
+_rendered = {}
+
+
+def endpoints():
+    global _endpoints, _by_path
+    if _endpoints is None:
+        loaded = load_endpoints()
+        _by_path = {endpoint.path: endpoint for endpoint in loaded.values() if endpoint.path}
+        _endpoints = loaded
+    return _endpoints
+
+
+def for_path(path):
+    endpoints()
+    return _by_path.get(path)
+
+
+def current_generation(endpoint):
+    return get_generation("pages") if endpoint.pages else None
+
+
+def is_rendered(endpoint, host):
+    rendered = _rendered.get((endpoint.name, endpoint.host_key(host)))
+    return rendered is not None and rendered.generation == current_generation(endpoint)
+
+
+def rendered(endpoint, host):
+    key = (endpoint.name, endpoint.host_key(host))
+    if not is_rendered(endpoint, host):
+        with _lock:
+            if not is_rendered(endpoint, host):
+                if len({host for _, host in _rendered}) >= MAX_HOSTS:
+                    _rendered.clear()
+                body = endpoint.render(host)
+                _rendered[key] = Rendered(
+                    body=body,
+                    etag='"{}"'.format(hashlib.md5(body).hexdigest()),
+                    variants=compress(body),
+                    generation=current_generation(endpoint),
+                )
+    return _rendered[key]
+
+
+def render_all():
+    """Рендерит всё заранее для основного хоста; вызывается при старте (gunicorn.conf.py)"""
+    for endpoint in endpoints().values():
+        rendered(endpoint, default_host())
+
+
+def accepted_encoding(request, variants):
+    accept = request.META.get("HTTP_ACCEPT_ENCODING", "")
+    for encoding in ("br", "gzip"):
+        if encoding in variants and encoding in accept:
+            return encoding
+    return None
+
+
+def response(request, name):
+    endpoint = endpoints()[name]
+    result = rendered(endpoint, request.get_host())
+    encoding = accepted_encoding(request, result.variants)
+    etag = result.etag if encoding is None else '{}-{}"'.format(result.etag[:-1], encoding)
+
+    if endpoint.status == 200 and etag in request.META.get("HTTP_IF_NONE_MATCH", ""):
+        response = HttpResponseNotModified()
+    else:
+        body = result.body if encoding is None else result.variants[encoding]
+        response = HttpResponse(body, content_type=endpoint.content_type, status=endpoint.status)
+        response["Content-Length"] = len(body)
+        if encoding:
+            response["Content-Encoding"] = encoding
+    if result.variants:
+        patch_vary_headers(response, ("Accept-Encoding",))
+    if endpoint.status == 200:
+        response["ETag"] = etag
+        response["Cache-Control"] = "public, max-age={}".format(endpoint.max_age)
+    return response
@@ -0,0 +1,65 @@
+# home/streaming.py
+"""
+Потоковая отдача страниц.
+
+Шаблон рендерится по узлам верхнего уровня, и после каждого
+{% include %} / inclusion-тега накопленный HTML отправляется клиенту.
+<head>, навигация и баннер уходят сразу, не дожидаясь таблиц цен,
+отзывов и подвала, поэтому время до первого байта не зависит от самого
+медленного include. Шаблоны с {% extends %} отдаются одним куском.
+"""
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from django.template import loader
+from django.template.context import make_context
+from django.template.library import InclusionNode
+from django.template.loader_tags import IncludeNode
+
+FLUSH_NODES = (IncludeNode, InclusionNode)
+
+
+def stream_template(template_name, context, request):
+    """Генератор кусков HTML шаблона template_name"""
+    backend_template = loader.get_template(template_name)
+    template = backend_template.template
+    context = make_context(context, request, autoescape=backend_template.backend.engine.autoescape)
+
+    # То же, что Template.render(), но с отдачей по узлам
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            chunk = []
+            for node in template.nodelist:
+                chunk.append(node.render_annotated(context))
+                if isinstance(node, FLUSH_NODES):
+                    yield "".join(chunk)
+                    chunk = []
+            yield "".join(chunk)
+
+
+class StreamingServeMixin:
+    """Отдаёт страницу потоком, если включён settings.PAGE_STREAMING"""
+
+    def serve(self, request, *args, **kwargs):
+        # Превью рендерится целиком. В ASGI Django 3.2 перебирает потоковый
+        # ответ прямо в event loop, где ленивые запросы к ORM запрещены.
+        if (
+            not getattr(settings, "PAGE_STREAMING", False)
+            or getattr(request, "is_preview", False)
+            or isinstance(request, ASGIRequest)
+        ):
+            return super().serve(request, *args, **kwargs)
+
+        request.is_preview = False
+        response = StreamingHttpResponse(
+            stream_template(
+                self.get_template(request, *args, **kwargs),
+                self.get_context(request, *args, **kwargs),
+                request,
+            ),
+            content_type="text/html; charset=utf-8",
+        )
+        # nginx не должен копить ответ в буфере
+        response["X-Accel-Buffering"] = "no"
+        return response
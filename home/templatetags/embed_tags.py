@@ -0,0 +1,51 @@
+# home/templatetags/embed_tags.py
+"""
+Встраивания Яндекса (карта, виджет отзывов) за заглушкой.
+
+Вместо iframe страница получает лёгкую локальную заглушку: карточку
+адреса из полей страницы или сводку оценок наших ClientReview. Настоящий
+iframe подставляется по клику (static/js/myproject.js). Какие встраивания
+прячутся за заглушкой, задаёт EMBED_FACADES по типу страницы.
+"""
+from django import template
+from django.conf import settings
+
+from home import reviews
+
+register = template.Library()
+
+MAP_URL = "https://yandex.ru/map-widget/v1/?ll=34.097897%2C44.954033&mode=search&oid=245071578035&ol=biz&z=16.64"
+MAP_ORG_URL = "https://yandex.ru/maps/org/pravovoy_ekspert/245071578035/?utm_medium=mapframe&utm_source=maps"
+REVIEWS_URL = "https://yandex.ru/maps-reviews-widget/245071578035?comments"
+REVIEWS_ORG_URL = "https://yandex.ru/maps/org/pravovoy_ekspert/245071578035/reviews/"
+
+
+def uses_facade(page, embed):
+    """embed ("map", "reviews") показывается заглушкой на странице этого типа"""
+    facades = settings.EMBED_FACADES
+    label = page._meta.label_lower if hasattr(page, "_meta") else None
+    return embed in facades.get(label, facades.get("default", ()))
+
+
+@register.inclusion_tag("includes/embeds/map.html", takes_context=True)
+def map_embed(context):
+    page = context.get("page")
+    return {
+        "page": page,
+        "facade": uses_facade(page, "map"),
+        "src": getattr(page, "map_url", "") or MAP_URL,
+        "org_url": MAP_ORG_URL,
+    }
+
+
+@register.inclusion_tag("includes/embeds/reviews.html", takes_context=True)
+def reviews_embed(context):
+    page = context.get("page")
+    facade = uses_facade(page, "reviews")
+    return {
+        "facade": facade,
+        "src": REVIEWS_URL,
+        "org_url": REVIEWS_ORG_URL,
+        "summary": reviews.summary() if facade else None,
+        "stars": range(1, 6),
+    }
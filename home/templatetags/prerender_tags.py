@@ -0,0 +1,13 @@
+# home/templatetags/prerender_tags.py
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def prerendered(context, page, field_name):
+    """HTML поля, отрендеренный при публикации; в превью — живой рендер"""
+    request = context.get('request')
+    if getattr(request, 'is_preview', False):
+        return page.render_field_html(field_name)
+    return page.get_prerendered_html(field_name)
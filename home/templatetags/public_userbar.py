@@ -0,0 +1,10 @@
+# home/templatetags/public_userbar.py
+from django import template
+
+register = template.Library()
+
+
+@register.simple_tag(takes_context=True)
+def wagtailuserbar(context, position="bottom-right"):
+    """Заглушка панели редактора для публичного пула воркеров"""
+    return ""
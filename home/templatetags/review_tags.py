@@ -1,11 +1,23 @@
 from django import template
-from home.models import ClientReview
+from home import reviews as review_queries
 
 register = template.Library()
 
 @register.simple_tag
 def get_reviews():
-    return ClientReview.objects.filter(is_published=True).order_by('-review_date')
+    """Первая страница опубликованных отзывов (home/reviews.py)"""
+    return review_queries.reviews_page()[0]
+
+@register.simple_tag
+def get_reviews_page(page=None):
+    """Первая страница отзывов и курсор для кнопки "Ещё отзывы" """
+    reviews, next_cursor = review_queries.reviews_page(page=page)
+    return {"reviews": reviews, "next": next_cursor}
+
+@register.simple_tag
+def get_review_summary():
+    """Средняя оценка и число всех опубликованных отзывов"""
+    return review_queries.summary()
 
 @register.filter
 def average_rating(reviews):
@@ -23,4 +35,4 @@ def average_rating(reviews):
     if count == 0:
         return 0
     
-    return round(total / count, 1)
\ No newline at end of file
+    return round(total / count, 1)
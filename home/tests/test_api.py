@@ -0,0 +1,39 @@
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from home.api import RESOURCES, ApiError, parse_params
+from home.reviews import encode_cursor
+
+
+@override_settings(API_PAGE_SIZE=20, API_MAX_PAGE_SIZE=100)
+class ParseParamsTests(SimpleTestCase):
+    resource = RESOURCES["reviews"]
+
+    def parse(self, query=""):
+        return parse_params(RequestFactory().get("/api/v1/reviews/?" + query), self.resource)
+
+    def test_defaults(self):
+        self.assertEqual(self.parse(), (list(self.resource.fields), 20, None))
+
+    def test_fields_projection(self):
+        fields, _, _ = self.parse("fields=id,title")
+        self.assertEqual(fields, ["id", "title"])
+
+    def test_unknown_field(self):
+        with self.assertRaises(ApiError):
+            self.parse("fields=id,password")
+
+    def test_limit_is_clamped(self):
+        self.assertEqual(self.parse("limit=1000")[1], 100)
+        self.assertEqual(self.parse("limit=0")[1], 1)
+
+    def test_limit_must_be_a_number(self):
+        with self.assertRaises(ApiError):
+            self.parse("limit=ten")
+
+    def test_cursor(self):
+        self.assertEqual(self.parse("cursor=" + encode_cursor(15))[2], 15)
+
+    def test_tampered_cursor(self):
+        for cursor in ("!!!", "a", encode_cursor("x"), encode_cursor(1, 2), encode_cursor("2024-03-01", 1)):
+            with self.subTest(cursor=cursor), self.assertRaises(ApiError):
+                self.parse("cursor=" + cursor)
@@ -0,0 +1,97 @@
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from wagtail.documents import get_document_model
+from wagtail.documents.models import document_served
+
+from home.media import parse_range, serve_media
+from home.views import serve_document
+
+ETAG = '"3e8-0"'
+SIZE = 1000
+
+
+class ParseRangeTests(SimpleTestCase):
+    def parse(self, header, size=SIZE, **extra):
+        request = RequestFactory().get("/", HTTP_RANGE=header, **extra)
+        return parse_range(request, ETAG, size)
+
+    def test_no_header(self):
+        self.assertIsNone(parse_range(RequestFactory().get("/"), ETAG, SIZE))
+
+    def test_closed_range(self):
+        self.assertEqual(self.parse("bytes=0-99"), (0, 99))
+
+    def test_open_range(self):
+        self.assertEqual(self.parse("bytes=900-"), (900, 999))
+
+    def test_end_past_file_is_clamped(self):
+        self.assertEqual(self.parse("bytes=500-5000"), (500, 999))
+
+    def test_suffix_range(self):
+        self.assertEqual(self.parse("bytes=-100"), (900, 999))
+
+    def test_suffix_longer_than_file(self):
+        self.assertEqual(self.parse("bytes=-5000"), (0, 999))
+
+    def test_start_past_file_is_unsatisfiable(self):
+        self.assertIs(self.parse("bytes=1000-"), False)
+
+    def test_empty_suffix_is_unsatisfiable(self):
+        self.assertIs(self.parse("bytes=-0"), False)
+
+    def test_inverted_range_is_ignored(self):
+        self.assertIsNone(self.parse("bytes=300-200"))
+
+    def test_malformed_headers_are_ignored(self):
+        for header in ("bytes=", "bytes=-", "bytes=a-b", "items=0-1", "bytes=0-1,5-6", "0-1", "bytes=-1-2"):
+            with self.subTest(header=header):
+                self.assertIsNone(self.parse(header))
+
+    def test_empty_file(self):
+        self.assertIsNone(self.parse("bytes=0-1", size=0))
+
+    def test_if_range_mismatch_returns_whole_file(self):
+        self.assertIsNone(self.parse("bytes=0-99", HTTP_IF_RANGE='"other"'))
+
+    def test_if_range_match(self):
+        self.assertEqual(self.parse("bytes=0-99", HTTP_IF_RANGE=ETAG), (0, 99))
+
+
+@override_settings(MEDIA_ROOT="/nonexistent-media-root", MEDIA_ACCEL=None)
+class ServeMediaTests(SimpleTestCase):
+    def test_documents_are_not_served(self):
+        from django.http import Http404
+
+        for path in ("documents/contract.pdf", "../documents/contract.pdf", "other/file.txt"):
+            with self.subTest(path=path), self.assertRaises(Http404):
+                serve_media(RequestFactory().get("/media/" + path), path)
+
+
+class ServeDocumentTests(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root, MEDIA_ACCEL=None)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.document = get_document_model().objects.create(
+            title="Договор", file=ContentFile(b"%PDF-1.4", name="contract.pdf")
+        )
+
+    def test_document_served_signal(self):
+        served = []
+
+        def receiver(sender, instance, request, **kwargs):
+            served.append((sender, instance, request))
+
+        document_served.connect(receiver)
+        self.addCleanup(document_served.disconnect, receiver)
+
+        request = RequestFactory().get("/documents/")
+        response = serve_document(request, self.document.id, self.document.filename)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(served, [(get_document_model(), self.document, request)])
@@ -0,0 +1,107 @@
+import shutil
+import tempfile
+
+from django.test import TestCase, override_settings
+from wagtail.models import Page, Site
+
+from home import cache as generations
+from home import not_found, static_endpoints
+from home.models import HomePage
+
+# Заголовки, которые ставят middleware ниже быстрых путей или сам ответ
+COMPARED_HEADERS = ("Content-Type", "X-Frame-Options", "X-Content-Type-Options", "Referrer-Policy")
+
+
+class FastPathTestCase(TestCase):
+    """Публичный URLconf, свой каталог кэша и поколений на каждый тест"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        settings_override = override_settings(
+            ROOT_URLCONF="myproject.urls_public",
+            CACHES={"default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": directory + "/cache",
+            }},
+            CACHE_GENERATIONS_DIR=directory + "/generations",
+            PAGE_SNAPSHOT_PATH=directory + "/pages.snapshot",
+            PAGE_CACHE_TIMEOUT=60,
+            PAGE_STREAMING=False,
+            SECURE_CONTENT_TYPE_NOSNIFF=True,
+            ALLOWED_HOSTS=["localhost", "testserver"],
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        # Состояние в памяти модулей переживает тесты
+        generations._local.clear()
+        not_found._missing.clear()
+        static_endpoints._rendered.clear()
+
+    def assertSameHeaders(self, first, second):
+        for name in COMPARED_HEADERS:
+            with self.subTest(header=name):
+                self.assertEqual(first.get(name), second.get(name))
+
+
+class CachedPageTests(FastPathTestCase):
+    def setUp(self):
+        super().setUp()
+        self.page = HomePage(title="Юрист по Крыму", slug="glavnaya", street_address="ул. Ленина, 1")
+        Page.get_first_root_node().add_child(instance=self.page)
+        self.page.save_revision().publish()
+        Site.objects.filter(is_default_site=True).update(root_page=self.page)
+
+    def test_hit_has_the_headers_of_a_miss(self):
+        miss = self.client.get(self.page.url)
+        self.assertEqual(miss.status_code, 200)
+        self.assertIsNone(miss.get("X-Page-Cache"))
+
+        with self.assertNumQueries(0):
+            hit = self.client.get(self.page.url)
+        self.assertEqual(hit.get("X-Page-Cache"), "hit")
+        self.assertEqual(hit.content, miss.content)
+        self.assertEqual(hit.get("X-Frame-Options"), "DENY")
+        self.assertEqual(hit.get("X-Content-Type-Options"), "nosniff")
+        self.assertSameHeaders(miss, hit)
+
+    def test_publish_invalidates_the_cache(self):
+        self.client.get(self.page.url)
+        self.page.title = "Юрист по Симферополю"
+        self.page.save_revision().publish()
+
+        response = self.client.get(self.page.url)
+        self.assertIsNone(response.get("X-Page-Cache"))
+
+    def test_requests_with_a_query_string_are_not_cached(self):
+        self.client.get(self.page.url + "?utm_source=x")
+        response = self.client.get(self.page.url + "?utm_source=x")
+        self.assertIsNone(response.get("X-Page-Cache"))
+
+
+class NotFoundTests(FastPathTestCase):
+    def test_repeated_404_skips_the_database_and_keeps_headers(self):
+        first = self.client.get("/wp-login.php")
+        self.assertEqual(first.status_code, 404)
+
+        with self.assertNumQueries(0):
+            repeated = self.client.get("/wp-login.php")
+        self.assertEqual(repeated.status_code, 404)
+        self.assertEqual(repeated.content, first.content)
+        self.assertEqual(repeated.get("X-Content-Type-Options"), "nosniff")
+        self.assertSameHeaders(first, repeated)
+
+    def test_documents_are_not_remembered(self):
+        self.client.get("/documents/999/absent.pdf")
+        self.assertFalse(not_found._missing)
+
+
+class StaticEndpointTests(FastPathTestCase):
+    def test_robots_txt_has_security_headers(self):
+        with self.assertNumQueries(0):
+            response = self.client.get("/robots.txt")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/plain; charset=utf-8")
+        self.assertEqual(response.get("X-Content-Type-Options"), "nosniff")
+        self.assertEqual(response.get("X-Frame-Options"), "DENY")
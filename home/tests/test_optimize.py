@@ -0,0 +1,114 @@
+import json
+import re
+
+from django.test import SimpleTestCase
+
+from home.optimize import build_sprites, merge_jsonld, minify, optimize_html
+
+BASE_URL = "https://crimea-yurist.ru/"
+ADDRESS = {
+    "@type": "PostalAddress",
+    "streetAddress": "ул. Долгоруковская, 7",
+    "addressLocality": "Симферополь",
+    "addressRegion": "Республика Крым",
+    "postalCode": "295000",
+    "addressCountry": "RU",
+}
+ICON = (
+    '<svg class="w-5 h-5 text-blue-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">'
+    '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" '
+    'd="M3 5a2 2 0 012-2h3.28a1 1 0 01.948.684l1.498 4.493a1 1 0 01-.502 1.21l-2.257 1.13'
+    'a11.042 11.042 0 005.516 5.516l1.13-2.257a1 1 0 011.21-.502l4.493 1.498a1 1 0 01.684.949V19'
+    'a2 2 0 01-2 2h-1C9.716 21 3 14.284 3 6V5z"/></svg>'
+)
+
+
+def jsonld(data):
+    text = json.dumps(data, ensure_ascii=False).replace("</", "<\\/")
+    return '<script type="application/ld+json">{}</script>'.format(text)
+
+
+def graph(html):
+    blocks = re.findall(r'<script type="application/ld\+json">(.*?)</script>', html, re.S)
+    return [json.loads(block) for block in blocks]
+
+
+class MergeJsonLdTests(SimpleTestCase):
+    def test_blocks_become_one_graph(self):
+        html = "<head>{}{}</head>".format(
+            jsonld({"@context": "https://schema.org", "@type": "LegalService", "name": "Юрист"}),
+            jsonld({"@context": "https://schema.org", "@type": "BreadcrumbList"}),
+        )
+        blocks = graph(merge_jsonld(html, BASE_URL))
+        self.assertEqual(len(blocks), 1)
+        self.assertEqual([node["@type"] for node in blocks[0]["@graph"]], ["LegalService", "BreadcrumbList"])
+
+    def test_repeated_nested_object_is_hoisted(self):
+        html = jsonld([
+            {"@type": "LegalService", "address": ADDRESS},
+            {"@type": "Attorney", "address": ADDRESS},
+        ])
+        nodes = graph(merge_jsonld(html, BASE_URL))[0]["@graph"]
+        address = [node for node in nodes if node["@type"] == "PostalAddress"]
+        self.assertEqual(len(address), 1)
+        reference = {"@id": address[0]["@id"]}
+        self.assertTrue(address[0]["@id"].startswith(BASE_URL + "#postaladdress-"))
+        self.assertEqual([node.get("address") for node in nodes if node["@type"] != "PostalAddress"], [reference, reference])
+
+    def test_duplicate_top_level_nodes_are_dropped(self):
+        node = {"@type": "Organization", "name": "Юрист"}
+        nodes = graph(merge_jsonld(jsonld(node) + jsonld(node), BASE_URL))[0]["@graph"]
+        self.assertEqual(nodes, [node])
+
+    def test_invalid_block_is_kept(self):
+        broken = '<script type="application/ld+json">{broken</script>'
+        self.assertEqual(merge_jsonld(broken, BASE_URL), broken)
+
+    def test_script_end_tag_is_escaped(self):
+        html = merge_jsonld(jsonld({"@type": "Thing", "name": "</script><b>"}), BASE_URL)
+        self.assertEqual(html.count("</script>"), 1)
+
+
+class SpritesTests(SimpleTestCase):
+    def test_repeated_icons_use_a_sprite(self):
+        html = "<html><body>{}</body></html>".format(
+            "".join('<li>{}<span>Пункт {}</span></li>'.format(ICON, number) for number in range(5))
+        )
+        optimized = build_sprites(html)
+        self.assertEqual(optimized.count("<symbol "), 1)
+        self.assertEqual(optimized.count('<use href="#svg-sprite-1"/>'), 5)
+        self.assertIn('<svg class="w-5 h-5 text-blue-600" fill="none" stroke="currentColor"><use', optimized)
+        self.assertLess(len(optimized), len(html))
+
+    def test_single_icon_is_left_inline(self):
+        html = "<html><body>{}</body></html>".format(ICON)
+        self.assertEqual(build_sprites(html), html)
+
+    def test_without_body(self):
+        self.assertEqual(build_sprites(ICON * 3), ICON * 3)
+
+
+class MinifyTests(SimpleTestCase):
+    def test_whitespace_and_comments(self):
+        self.assertEqual(minify("<div>\n    <!-- note -->\n    <p>a   b</p>\n</div>\n"), "<div> <p>a b</p> </div>")
+
+    def test_protected_blocks(self):
+        html = "<pre>  a\n  b</pre>  <textarea> x  </textarea>  <script>var a  =  1;</script>"
+        self.assertEqual(minify(html), "<pre>  a\n  b</pre> <textarea> x  </textarea> <script>var a  =  1;</script>")
+
+    def test_conditional_comments_are_kept(self):
+        html = "<!--[if IE]><p>IE</p><![endif]-->"
+        self.assertEqual(minify(html), html)
+
+
+class OptimizeHtmlTests(SimpleTestCase):
+    def test_savings_per_step(self):
+        html = "<html><head>{}{}</head><body>\n  <!-- x -->\n  {}</body></html>".format(
+            jsonld({"@context": "https://schema.org", "@type": "LegalService", "address": ADDRESS}),
+            jsonld({"@context": "https://schema.org", "@type": "Attorney", "address": ADDRESS}),
+            ICON * 4,
+        )
+        optimized, savings = optimize_html(html, BASE_URL)
+        self.assertEqual(set(savings), {"jsonld", "sprites", "minify"})
+        self.assertTrue(all(saved > 0 for saved in savings.values()), savings)
+        self.assertEqual(len(html.encode()) - len(optimized.encode()), sum(savings.values()))
@@ -0,0 +1,57 @@
+import base64
+import datetime
+
+from django.test import SimpleTestCase
+
+from home.reviews import InvalidCursor, decode_cursor, encode_cursor, normalize_cursor
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        cursor = encode_cursor(datetime.date(2024, 3, 1).isoformat(), 42)
+        self.assertEqual(decode_cursor(cursor, datetime.date.fromisoformat, int), (datetime.date(2024, 3, 1), 42))
+
+    def test_cursor_is_url_safe_without_padding(self):
+        cursor = encode_cursor("2024-03-01", 1)
+        self.assertNotIn("=", cursor)
+        self.assertRegex(cursor, r"^[A-Za-z0-9_-]+$")
+
+    def test_single_value(self):
+        self.assertEqual(decode_cursor(encode_cursor(7), int), (7,))
+
+    def test_tampered_cursors(self):
+        cursors = [
+            "",
+            "!!!",
+            "a",
+            base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+            encode_cursor("2024-13-01", 1),
+            encode_cursor("2024-03-01", "x"),
+            encode_cursor("2024-03-01"),
+            encode_cursor("2024-03-01", 1, 2),
+        ]
+        for cursor in cursors:
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                decode_cursor(cursor, datetime.date.fromisoformat, int)
+
+
+class NormalizeCursorTests(SimpleTestCase):
+    def test_empty_cursor(self):
+        self.assertEqual(normalize_cursor(""), "")
+
+    def test_spellings_of_one_cursor_are_equal(self):
+        canonical = encode_cursor("2024-03-05", 42)
+        spellings = [
+            canonical,
+            canonical + "==",
+            encode_cursor("2024-03-05", "042"),
+            encode_cursor("2024-03-05", "+42"),
+            encode_cursor("20240305", 42),
+        ]
+        for cursor in spellings:
+            with self.subTest(cursor=cursor):
+                self.assertEqual(normalize_cursor(cursor), canonical)
+
+    def test_tampered_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            normalize_cursor(encode_cursor("2024-03-05"))
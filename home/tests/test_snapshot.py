@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase
+
+from home.snapshot import MAGIC, PageSummary, Snapshot, encode
+
+
+def summary(page_id, parent_id, depth, in_menu, title, path=None, url=None):
+    return PageSummary(
+        id=page_id, parent_id=parent_id, depth=depth, in_menu=in_menu,
+        path=path or "0001" * depth, url=url if url is not None else "/{}/".format(page_id), title=title,
+    )
+
+
+SUMMARIES = [
+    summary(3, 0, 2, False, "Главная", url="/"),
+    summary(10, 3, 3, True, "Симферополь"),
+    summary(5, 10, 4, True, "Развод"),
+    summary(7, 3, 3, False, "Контакты", url=""),
+]
+
+
+class SnapshotTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def open(self, data):
+        path = os.path.join(self.directory, "pages.snapshot")
+        with open(path, "wb") as snapshot_file:
+            snapshot_file.write(data)
+        return Snapshot(path)
+
+    def test_round_trip(self):
+        snapshot = self.open(encode(SUMMARIES))
+        self.assertEqual(len(snapshot), len(SUMMARIES))
+        self.assertEqual(list(snapshot), SUMMARIES)
+
+    def test_get_by_id(self):
+        snapshot = self.open(encode(SUMMARIES))
+        for item in SUMMARIES:
+            with self.subTest(id=item.id):
+                self.assertEqual(snapshot.get(item.id), item)
+        self.assertIsNone(snapshot.get(4))
+        self.assertIsNone(snapshot.get(100))
+
+    def test_non_ascii_and_empty_strings(self):
+        snapshot = self.open(encode(SUMMARIES))
+        self.assertEqual(snapshot.get(5).title, "Развод")
+        self.assertEqual(snapshot.get(7).url, "")
+
+    def test_children_and_menu(self):
+        snapshot = self.open(encode(SUMMARIES))
+        self.assertEqual([item.id for item in snapshot.children(3)], [10, 7])
+        self.assertEqual([item.id for item in snapshot.children(3, in_menu=True)], [10])
+        self.assertEqual([item.id for item in snapshot.menu_pages(depth=3)], [10])
+
+    def test_empty(self):
+        snapshot = self.open(encode([]))
+        self.assertEqual(len(snapshot), 0)
+        self.assertIsNone(snapshot.get(1))
+
+    def test_unknown_format(self):
+        data = encode(SUMMARIES)
+        with self.assertRaises(ValueError):
+            self.open(b"CYSNAP01" + data[len(MAGIC):])
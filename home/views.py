@@ -0,0 +1,95 @@
+# home/views.py
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+from wagtail import hooks
+from wagtail.documents import get_document_model
+from wagtail.documents.models import document_served
+from wagtail.models import Site
+
+from . import media, reviews, routing
+from .cache import get_generation
+
+
+def serve(request, path):
+    """wagtail.views.serve с кэшем маршрутов (home/routing.py)"""
+    site = Site.find_for_request(request)
+    if not site:
+        raise Http404
+
+    path_components = [component for component in path.split("/") if component]
+    page = routing.cached_page(site, path_components)
+    if page is not None:
+        args, kwargs = [], {}
+    else:
+        page, args, kwargs = site.root_page.localized.specific.route(request, path_components)
+        # Маршруты с аргументами (RoutablePage) не кэшируем
+        if not args and not kwargs:
+            routing.remember(site, path_components, page)
+
+    for fn in hooks.get_hooks("before_serve_page"):
+        result = fn(page, request, args, kwargs)
+        if isinstance(result, HttpResponse):
+            return result
+
+    return page.serve(request, *args, **kwargs)
+
+
+def serve_document(request, document_id, document_filename):
+    """wagtail.documents serve без копирования файла через Python (home/media.py)"""
+    document = get_object_or_404(get_document_model(), id=document_id)
+    if document.filename != document_filename:
+        raise Http404
+
+    # Ограничения просмотра коллекции и прочие хуки wagtail.documents
+    for fn in hooks.get_hooks("before_serve_document"):
+        result = fn(document, request)
+        if isinstance(result, HttpResponse):
+            return result
+
+    if document.collection.get_view_restrictions().exists():
+        cache_control = "private, no-cache"
+    else:
+        cache_control = "public, max-age={}".format(settings.MEDIA_CACHE_MAX_AGE)
+
+    # Как в wagtail.documents: на сигнал подписана статистика скачиваний
+    document_served.send(sender=get_document_model(), instance=document, request=request)
+    return media.serve_file(
+        request, document.file.path, cache_control,
+        content_type=document.content_type, disposition=document.content_disposition,
+    )
+
+
+@require_GET
+def more_reviews(request):
+    """Следующая страница отзывов для кнопки "Ещё отзывы": {"html", "next"}"""
+    practice = request.GET.get("practice")
+    if practice is not None and not practice.isdigit():
+        return HttpResponseBadRequest()
+    practice = practice and int(practice)
+    try:
+        cursor = reviews.normalize_cursor(request.GET.get("cursor", ""))
+    except reviews.InvalidCursor:
+        return HttpResponseBadRequest()
+
+    key = "reviews-more:{}:{}:{}".format(get_generation("pages"), practice, cursor)
+    data = cache.get(key)
+    if data is None:
+        page_reviews, next_cursor = reviews.reviews_page(page=practice, cursor=cursor)
+
+        card_template = "includes/practice_review.html" if practice else "includes/review_card.html"
+        next_url = None
+        if next_cursor:
+            next_url = "{}?{}cursor={}".format(
+                reverse("more_reviews"), "practice={}&".format(practice) if practice else "", next_cursor
+            )
+        data = {
+            "html": render_to_string("includes/reviews_more.html", {"reviews": page_reviews, "card_template": card_template}),
+            "next": next_url,
+        }
+        cache.set(key, data, settings.PAGE_CACHE_TIMEOUT)
+    return JsonResponse(data)
@@ -0,0 +1,9 @@
+# home/wagtail_hooks.py
+from wagtail import hooks
+
+
+@hooks.register("before_serve_page")
+def mark_page_cacheable(page, request, serve_args, serve_kwargs):
+    """Страницы без ограничений просмотра можно отдавать из кэша (home/page_cache.py)"""
+    if not page.get_view_restrictions().exists():
+        request.is_cacheable_page = True
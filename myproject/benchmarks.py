@@ -0,0 +1,337 @@
+# myproject/benchmarks.py
+"""
+Бенчмарки производительности сайта.
+
+Запуск: python manage.py benchmark <набор> [опции]
+Набор — функция, зарегистрированная декоратором @benchmark. Она получает
+опции команды и возвращает список строк (словарей), которые команда
+печатает таблицей.
+"""
+import http.client
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+SUITES = {}
+
+
+def benchmark(name):
+    """Регистрирует набор бенчмарков под именем name"""
+    def decorator(func):
+        SUITES[name] = func
+        return func
+    return decorator
+
+
+def summarize(samples):
+    """Медиана и максимум выборки в миллисекундах"""
+    return {
+        "median_ms": round(statistics.median(samples), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def timed(func, repeat):
+    """Замеряет func repeat раз, возвращает выборку в миллисекундах"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+# Старт воркера
+
+STARTUP_SETTINGS = [
+    "myproject.settings.production",
+    "myproject.settings.public",
+]
+
+# Выполняется в отдельном процессе: холодный импорт Django и URLconf,
+# как при загрузке воркера без preload
+STARTUP_SCRIPT = """
+import json, resource, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps({
+    "boot_ms": (time.perf_counter() - started) * 1000,
+    "maxrss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}))
+"""
+
+
+def boot_process(settings_module):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings_module)
+    output = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@benchmark("startup")
+def startup(options):
+    """Время загрузки приложения и память холодного воркера по профилям"""
+    rows = []
+    for settings_module in options["settings_module"] or STARTUP_SETTINGS:
+        runs = [boot_process(settings_module) for _ in range(options["repeat"])]
+        row = {"settings": settings_module}
+        row.update(summarize([run["boot_ms"] for run in runs]))
+        row["maxrss_kib"] = max(run["maxrss_kib"] for run in runs)
+        row["modules"] = runs[-1]["modules"]
+        rows.append(row)
+    return rows
+
+
+# Нагрузка на запущенный сервер
+
+def fetch(url):
+    """Время ответа в миллисекундах или None при ошибке"""
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=30) as response:
+            response.read()
+    except (OSError, http.client.HTTPException):
+        return None
+    return (time.perf_counter() - started) * 1000
+
+
+@benchmark("load")
+def load(options):
+    """
+    Пропускная способность запущенного сервера при заданной конкурентности.
+
+    Для сравнения WSGI и ASGI запустите оба режима на разных портах и
+    передайте адреса через --url.
+    """
+    rows = []
+    for url in options["url"]:
+        for concurrency in options["concurrency"] or [10, 50, 200]:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results = list(executor.map(fetch, [url] * options["requests"]))
+            elapsed = time.perf_counter() - started
+
+            latencies = sorted(result for result in results if result is not None)
+            row = {"url": url, "concurrency": concurrency, "rps": round(len(latencies) / elapsed, 1)}
+            if latencies:
+                row["p50_ms"] = round(latencies[len(latencies) // 2], 1)
+                row["p95_ms"] = round(latencies[int(len(latencies) * 0.95) - 1], 1)
+            row["errors"] = len(results) - len(latencies)
+            rows.append(row)
+    return rows
+
+
+# Время до первого байта
+
+def first_byte(client, path):
+    """(время до первого куска, время полного ответа) в миллисекундах"""
+    started = time.perf_counter()
+    response = client.get(path)
+    chunks = iter(response.streaming_content) if response.streaming else iter([response.content])
+    next(chunks, b"")
+    ttfb = (time.perf_counter() - started) * 1000
+    for _ in chunks:
+        pass
+    response.close()
+    return ttfb, (time.perf_counter() - started) * 1000
+
+
+@benchmark("ttfb")
+def ttfb(options):
+    """Время до первого байта и полного ответа: обычный рендер против потокового"""
+    from django.test import Client, override_settings
+
+    client = Client(HTTP_HOST=options["host"])
+    rows = []
+    for path in options["path"] or ["/"]:
+        for streaming in (False, True):
+            with override_settings(PAGE_STREAMING=streaming, PAGE_CACHE_TIMEOUT=0):
+                runs = [first_byte(client, path) for _ in range(options["repeat"])]
+            rows.append({
+                "path": path,
+                "mode": "stream" if streaming else "template",
+                "ttfb_ms": summarize([run[0] for run in runs])["median_ms"],
+                "total_ms": summarize([run[1] for run in runs])["median_ms"],
+            })
+    return rows
+
+
+# Маршрутизация страниц
+
+def service_paths():
+    from home.models import ServicePage
+
+    return [page.url for page in ServicePage.objects.live()[:5] if page.url]
+
+
+@benchmark("routing")
+def routing(options):
+    """Поиск страницы по пути: Page.route() по дереву против кэша маршрутов"""
+    from django.db import connection
+    from django.test import RequestFactory
+    from django.test.utils import CaptureQueriesContext
+    from wagtail.models import Site
+
+    from home import routing as route_cache
+
+    rows = []
+    for path in options["path"] or service_paths():
+        request = RequestFactory().get(path, HTTP_HOST=options["host"])
+        site = Site.find_for_request(request)
+        components = [component for component in path.split("/") if component]
+
+        def tree():
+            return site.root_page.localized.specific.route(request, components)
+
+        def cached():
+            return route_cache.cached_page(site, components)
+
+        route_cache.remember(site, components, tree()[0])
+        for mode, func in (("tree", tree), ("cache", cached)):
+            with CaptureQueriesContext(connection) as queries:
+                func()
+            row = {"path": path, "mode": mode, "queries": len(queries)}
+            row.update(summarize(timed(func, options["repeat"])))
+            rows.append(row)
+    return rows
+
+
+# Встраивания Яндекса
+
+@benchmark("embeds")
+def embeds(options):
+    """Вес HTML и число сторонних iframe: встраивания Яндекса против заглушек"""
+    from django.test import Client, override_settings
+
+    client = Client(HTTP_HOST=options["host"])
+    rows = []
+    for path in options["path"] or ["/"] + service_paths()[:1]:
+        for mode, facades in (("iframe", ()), ("facade", ("map", "reviews"))):
+            with override_settings(EMBED_FACADES={"default": facades}, PAGE_CACHE_TIMEOUT=0, PAGE_STREAMING=False):
+                content = client.get(path).content
+                row = {
+                    "path": path,
+                    "mode": mode,
+                    "html_bytes": len(content),
+                    "iframes": content.count(b"<iframe"),
+                }
+                row.update(summarize(timed(lambda: client.get(path), options["repeat"])))
+            rows.append(row)
+    return rows
+
+
+# Оптимизация HTML
+
+def sample_pages():
+    """По одной опубликованной странице каждого типа"""
+    from wagtail.models import Page
+
+    pages = {}
+    for page in Page.objects.live().filter(depth__gt=1).specific().order_by("path"):
+        pages.setdefault(page._meta.label_lower, page)
+    return [(label, page.url) for label, page in pages.items() if page.url]
+
+
+@benchmark("optimize")
+def optimize(options):
+    """Экономия байт на шагах home/optimize.py по типам страниц"""
+    from django.test import Client, override_settings
+
+    from home.optimize import optimize_html
+
+    client = Client(HTTP_HOST=options["host"])
+    targets = [("-", path) for path in options["path"]] or sample_pages()
+    rows = []
+    for label, path in targets:
+        with override_settings(PAGE_CACHE_TIMEOUT=0, PAGE_STREAMING=False):
+            response = client.get(path)
+        html = response.content.decode(response.charset)
+        base_url = "http://{}{}".format(options["host"], path)
+        optimized, savings = optimize_html(html, base_url)
+
+        before = len(response.content)
+        after = len(optimized.encode("utf-8"))
+        row = {"type": label, "path": path, "bytes": before, "optimized": after}
+        row.update(savings)
+        row["saved_pct"] = round((before - after) * 100 / before, 1) if before else 0
+        row.update(summarize(timed(lambda: optimize_html(html, base_url), options["repeat"])))
+        rows.append(row)
+    return rows
+
+
+# JSON API
+
+@benchmark("api")
+def api(options):
+    """
+    Запросы к БД и время ответа JSON API (home/api.py) по размеру страницы:
+    cold — без кэша, warm — из кэша, 304 — опрос с If-None-Match.
+
+    Нагрузку опрашивающих клиентов на запущенный сервер даёт набор load:
+    benchmark load --url http://localhost:8000/api/v1/services/
+    """
+    from django.db import connection
+    from django.test import Client, override_settings
+    from django.test.utils import CaptureQueriesContext
+
+    from home.api import RESOURCES
+
+    client = Client(HTTP_HOST=options["host"])
+    rows = []
+    for name in RESOURCES:
+        for limit in (10, 50, 100):
+            path = "/api/v1/{}/?limit={}".format(name, limit)
+            etag = client.get(path)["ETag"]
+            modes = (
+                ("cold", {"API_CACHE_TIMEOUT": 0}, {}),
+                ("warm", {}, {}),
+                ("304", {}, {"HTTP_IF_NONE_MATCH": etag}),
+            )
+            for mode, overrides, headers in modes:
+                with override_settings(**overrides):
+                    with CaptureQueriesContext(connection) as queries:
+                        status = client.get(path, **headers).status_code
+                    row = {"resource": name, "limit": limit, "mode": mode, "status": status, "queries": len(queries)}
+                    row.update(summarize(timed(lambda: client.get(path, **headers), options["repeat"])))
+                rows.append(row)
+    return rows
+
+
+# Статические ответы
+
+@benchmark("static")
+def static(options):
+    """robots.txt и 404 из home/static_endpoints.py: запросы к БД, размер и время"""
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import CaptureQueriesContext
+
+    client = Client(HTTP_HOST=options["host"])
+    rows = []
+    for path in options["path"] or ["/robots.txt", "/no-such-page/"]:
+        client.get(path)
+        for encoding in ("", "gzip"):
+            headers = {"HTTP_ACCEPT_ENCODING": encoding} if encoding else {}
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(path, **headers)
+            row = {
+                "path": path,
+                "encoding": encoding or "identity",
+                "status": response.status_code,
+                "bytes": len(response.content),
+                "queries": len(queries),
+            }
+            row.update(summarize(timed(lambda: client.get(path, **headers), options["repeat"])))
+            rows.append(row)
+    return rows
@@ -49,15 +49,19 @@ INSTALLED_APPS = [
     "django.contrib.sitemaps",   
 ]
 
+# Заголовки безопасности ставятся до быстрых путей (home/middleware.py):
+# готовые ответы из памяти и кэша возвращаются, минуя всё, что ниже них
 MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "home.middleware.static_endpoint_middleware",
+    "home.middleware.not_found_middleware",
+    "home.middleware.cached_page_middleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "django.middleware.security.SecurityMiddleware",
-    "wagtail.contrib.redirects.middleware.RedirectMiddleware",
 ]
 
 ROOT_URLCONF = "myproject.urls"
@@ -75,7 +79,6 @@ TEMPLATES = [
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
-                'home.context_processors.menu_pages',
                 'wagtail.contrib.settings.context_processors.settings',  # Эта строка должна быть
             ],
         },
@@ -85,6 +88,7 @@ TEMPLATES = [
 WAGTAIL_404_TEMPLATE = '404.html'
 
 WSGI_APPLICATION = "myproject.wsgi.application"
+ASGI_APPLICATION = "myproject.asgi.application"
 
 # settings.py
 WAGTAILIMAGES_FORMAT_CONVERSIONS = {
@@ -98,6 +102,16 @@ WAGTAILIMAGES_WEBP_QUALITY = 80  # Качество 80%
 # Оптимизация размеров
 WAGTAILIMAGES_MAX_UPLOAD_SIZE = 20 * 1024 * 1024  # 20MB максимум
 
+# Загрузки пишутся во временный файл, а не в память
+FILE_UPLOAD_HANDLERS = ["django.core.files.uploadhandler.TemporaryFileUploadHandler"]
+
+# Оригиналы изображений обрабатываются в фоне (home/images.py): без
+# метаданных и не больше IMAGE_INGEST_MAX_SIZE пикселей по большей стороне
+IMAGE_INGEST_MAX_SIZE = 2560
+IMAGE_INGEST_WORKERS = 2
+# Рендишены, которые готовятся сразу после загрузки
+IMAGE_INGEST_RENDITIONS = ["width-400", "width-1200"]
+
 
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
@@ -109,6 +123,41 @@ DATABASES = {
     }
 }
 
+# Cache
+# Файловый кэш общий для всех воркеров на сервере: публикация в одном
+# воркере сбрасывает кэш страниц во всех (см. home/cache.py). Если
+# админка работает в отдельном контейнере, CACHE_DIR должен быть общим
+# томом обоих контейнеров, иначе публикация не сбросит публичный кэш.
+CACHE_DIR = os.getenv("CACHE_DIR") or os.path.join(BASE_DIR, "cache")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": CACHE_DIR,
+        "TIMEOUT": 60 * 60,
+        "OPTIONS": {
+            "MAX_ENTRIES": 10000,
+        },
+    }
+}
+
+# Поколения кэша (home/cache.py): файлы вне записей кэша, их не удалит
+# очистка при переполнении
+CACHE_GENERATIONS_DIR = os.path.join(CACHE_DIR, "generations")
+
+# Время жизни готового HTML страниц и sitemap.xml, 0 — не кэшировать
+PAGE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# HTML перед записью в кэш: один JSON-LD @graph, SVG-спрайты, без лишних
+# пробелов и комментариев (home/optimize.py)
+PAGE_OPTIMIZE_HTML = True
+
+# Снимок сводки опубликованных страниц, общий для воркеров (home/snapshot.py)
+PAGE_SNAPSHOT_PATH = os.path.join(CACHE_DIR, "pages.snapshot")
+
+# Потоковая отдача длинных страниц (home/streaming.py), только WSGI
+PAGE_STREAMING = True
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 SILENCED_SYSTEM_CHECKS = ["fields.E180"]
 #JSONFIELD_ENCODED = True
@@ -171,6 +220,14 @@ STATIC_URL = "/myproject/static/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "/media/"
 
+# Отдача медиафайлов и документов (home/media.py): None — FileResponse,
+# "x-accel-redirect" — nginx (internal location MEDIA_ACCEL_PREFIX -> MEDIA_ROOT),
+# "x-sendfile" — Apache/lighttpd
+MEDIA_ACCEL = None
+MEDIA_ACCEL_PREFIX = "/protected-media/"
+# Кэш изображений и документов в браузере
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24
+
 
 # Wagtail settings
 
@@ -181,9 +238,56 @@ WAGTAIL_SITE_NAME = "crimea-yurist.ru"
 WAGTAILSEARCH_BACKENDS = {
     "default": {
         "BACKEND": "wagtail.search.backends.database",
+        # Индекс обновляется отложенно, пачками (search/index_queue.py)
+        "AUTO_UPDATE": False,
     }
 }
 
+# Очередь обновлений индекса применяется не чаще раза в
+# SEARCH_INDEX_QUEUE_DELAY секунд, по SEARCH_INDEX_BATCH_SIZE объектов в транзакции
+SEARCH_INDEX_QUEUE_DELAY = 5
+SEARCH_INDEX_BATCH_SIZE = 100
+
+# Отзывов на страницу в списках и по кнопке "Ещё отзывы" (home/reviews.py)
+REVIEWS_PAGE_SIZE = 10
+
+# JSON API (home/api.py): размер страницы и кэш ответов; ключ кэша меняется
+# при публикации, поэтому время жизни большое, 0 — не кэшировать
+API_PAGE_SIZE = 20
+API_MAX_PAGE_SIZE = 100
+API_CACHE_TIMEOUT = 60 * 60 * 24
+API_CLIENT_MAX_AGE = 60
+
+# Встраивания Яндекса ("map", "reviews"), которые до клика показываются
+# локальной заглушкой, по типу страницы; "default" — для остальных типов
+# (home/templatetags/embed_tags.py)
+EMBED_FACADES = {
+    "default": ("map", "reviews"),
+}
+
+# Ответы, которые рендерятся один раз и отдаются байтами
+# (home/static_endpoints.py); с path — отдаются middleware по пути,
+# pages=True — перерендериваются после публикации (в шаблоне меню)
+STATIC_ENDPOINTS = [
+    {"name": "robots", "path": "/robots.txt", "template": "robots.txt",
+     "content_type": "text/plain; charset=utf-8", "max_age": 60 * 60 * 24},
+    {"name": "404", "template": "404.html", "status": 404, "pages": True},
+    {"name": "500", "template": "500.html", "status": 500, "pages": True},
+]
+# Файлы подтверждения владения сайтом (Яндекс.Вебмастер и т.п.): имя -> содержимое
+SITE_VERIFICATION_FILES = {}
+
+# Сколько отсутствующих путей помнит каждый воркер (home/not_found.py)
+NOT_FOUND_CACHE_SIZE = 4096
+# 404 по этим путям не запоминаются: документ или изображение появляется
+# после загрузки, без смены поколения страниц
+NOT_FOUND_SKIP_PREFIXES = ("/documents/", MEDIA_URL)
+
+# Статистика поиска копится в памяти воркера и пишется в БД пакетами
+# не чаще раза в SEARCH_STATS_FLUSH_INTERVAL секунд (search/analytics.py)
+SEARCH_STATS_FLUSH_INTERVAL = 60
+SEARCH_STATS_MAX_PENDING = 500
+
 # Base URL to use when referring to full URLs within the Wagtail admin backend -
 # e.g. in notification emails. Don't include '/admin' or a trailing slash
 WAGTAILADMIN_BASE_URL = "https://crimea-yurist.ru"
@@ -9,6 +9,9 @@ SECRET_KEY = "#"
 # SECURITY WARNING: define the correct hosts in production!
 ALLOWED_HOSTS = ["*"]
 
+# Страницы в разработке всегда рендерятся заново
+PAGE_CACHE_TIMEOUT = 0
+
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
 try:
@@ -8,6 +8,9 @@ load_dotenv()
 
 SECRET_KEY = os.getenv('SECRET_KEY')
 
+# Передача медиафайлов веб-серверу (home/media.py), например x-accel-redirect
+MEDIA_ACCEL = os.getenv('MEDIA_ACCEL') or None
+
 ALLOWED_HOSTS = [
     'localhost',
     '127.0.0.1',
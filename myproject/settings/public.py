@@ -0,0 +1,26 @@
+# settings/public.py
+# Профиль публичного пула воркеров: production без админки.
+# Запросы к /admin/ и /django-admin/ фронтовой веб-сервер отправляет
+# в отдельный пул с settings.production.
+from .production import *
+
+# Приложения, которые нужны только редакторам
+PUBLIC_SKIPPED_APPS = [
+    "wagtail.contrib.forms",
+    "django.contrib.admin",
+]
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in PUBLIC_SKIPPED_APPS]
+
+ROOT_URLCONF = "myproject.urls_public"
+
+# Без админских URL панель редактора {% wagtailuserbar %} не сможет
+# построить ссылки, поэтому в публичном пуле она заменена заглушкой.
+TEMPLATES[0]["OPTIONS"]["libraries"] = {
+    "wagtailuserbar": "home.templatetags.public_userbar",
+}
+
+try:
+    from .local import *
+except ImportError:
+    pass
@@ -0,0 +1,42 @@
+// Заглушки встраиваний (home/templatetags/embed_tags.py): iframe подгружается по клику
+document.addEventListener("click", function (event) {
+  const button = event.target.closest(".embed-facade-load");
+  if (!button) {
+    return;
+  }
+  const facade = button.closest(".embed-facade");
+  const iframe = document.createElement("iframe");
+  iframe.src = facade.dataset.embedSrc;
+  iframe.title = facade.dataset.embedTitle;
+  if (facade.dataset.embedClass) {
+    iframe.className = facade.dataset.embedClass;
+  }
+  if (facade.dataset.embedStyle) {
+    iframe.style.cssText = facade.dataset.embedStyle;
+  }
+  iframe.setAttribute("allowfullscreen", "");
+  facade.replaceWith(iframe);
+});
+
+// Кнопка "Ещё отзывы" (home/views.py more_reviews): следующая страница по курсору
+document.addEventListener("click", function (event) {
+  const button = event.target.closest(".reviews-load-more");
+  if (!button) {
+    return;
+  }
+  button.disabled = true;
+  fetch(button.dataset.next)
+    .then((response) => response.json())
+    .then((data) => {
+      document.querySelector(button.dataset.target).insertAdjacentHTML("beforeend", data.html);
+      if (data.next) {
+        button.dataset.next = data.next;
+        button.disabled = false;
+      } else {
+        button.remove();
+      }
+    })
+    .catch(() => {
+      button.disabled = false;
+    });
+});
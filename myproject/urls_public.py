@@ -0,0 +1,51 @@
+# myproject/urls_public.py
+"""
+Публичный URLconf: только то, что нужно посетителям сайта.
+
+Не импортирует wagtail.admin.urls и django.contrib.admin, поэтому воркеры
+публичного пула (settings.public) не тянут админку в память. Полный набор
+маршрутов собирается в myproject.urls.
+"""
+from django.conf import settings
+from django.urls import include, path, re_path
+
+from wagtail import urls as wagtail_urls
+from wagtail.urls import serve_pattern
+from wagtail.documents import urls as wagtaildocs_urls
+
+from home import api, media, views as home_views
+from search import views as search_views
+from .views import custom_404, custom_500, sitemap_xml
+
+handler404 = custom_404
+handler500 = custom_500
+
+# Маршруты до wagtail_urls: документы, поиск, sitemap.
+# robots.txt отдаёт static_endpoint_middleware (home/static_endpoints.py)
+site_urlpatterns = [
+    # Файлы документов отдаёт home.views.serve_document (X-Accel-Redirect
+    # или FileResponse), остальное — wagtaildocs_urls
+    path("documents/<int:document_id>/<str:document_filename>", home_views.serve_document, name="wagtaildocs_serve"),
+    path("documents/", include(wagtaildocs_urls)),
+    path("search/", search_views.search, name="search"),
+    path("reviews/more/", home_views.more_reviews, name="more_reviews"),
+    re_path(r"^api/v1/(?P<name>{})/$".format("|".join(api.RESOURCES)), api.resource_list, name="api"),
+
+    # sitemap.xml
+    path('sitemap.xml', sitemap_xml),
+]
+
+# Медиафайлы: X-Accel-Redirect/X-Sendfile, если настроен веб-сервер, иначе FileResponse
+site_urlpatterns += [
+    re_path(r"^{}(?P<path>.*)$".format(settings.MEDIA_URL.lstrip("/")), media.serve_media),
+]
+
+# Страницы Wagtail должны идти последними: они ловят любой путь.
+# Обычные страницы отдаёт home.views.serve с кэшем маршрутов,
+# остальное (пароли страниц и т.п.) — wagtail_urls
+page_urlpatterns = [
+    re_path(serve_pattern, home_views.serve, name="wagtail_serve"),
+    path("", include(wagtail_urls)),
+]
+
+urlpatterns = site_urlpatterns + page_urlpatterns
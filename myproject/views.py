@@ -1,10 +1,50 @@
 # myproject/views.py
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sitemaps.views import sitemap
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseServerError
+
+from home import static_endpoints
+from home.cache import get_generation
+from home.not_found import not_found_response
+from .sitemaps import CustomSitemap
+
 
 def custom_404(request, exception=None):
-    """Кастомная страница 404"""
-    return render(request, '404.html', status=404)
+    """Кастомная страница 404 (рендерится один раз, см. home/not_found.py)"""
+    return not_found_response(request)
 
 def custom_500(request):
-    """Кастомная страница 500"""
-    return render(request, '500.html', status=500)
\ No newline at end of file
+    """Кастомная страница 500, отрендеренная заранее (home/static_endpoints.py)"""
+    try:
+        return static_endpoints.response(request, '500')
+    except Exception:
+        # Шаблон не отрендерить (например, недоступна БД) — хотя бы текст
+        return HttpResponseServerError('Внутренняя ошибка сервера', content_type='text/plain; charset=utf-8')
+
+
+def render_sitemap(request):
+    response = sitemap(request, sitemaps={'pages': CustomSitemap})
+    response.render()
+    return response.content, response.get('Last-Modified')
+
+def cached_sitemap(request):
+    """(content, Last-Modified): файловый кэш и ORM — блокирующие, вне event loop"""
+    key = 'sitemap-xml:{}:{}:{}:{}'.format(
+        get_generation('pages'), request.scheme, request.get_host(), request.GET.get('p', 1)
+    )
+    entry = cache.get(key)
+    if entry is None:
+        entry = render_sitemap(request)
+        cache.set(key, entry, settings.PAGE_CACHE_TIMEOUT)
+    return entry
+
+async def sitemap_xml(request):
+    """sitemap.xml из кэша; пересобирается после публикации страниц"""
+    content, last_modified = await sync_to_async(cached_sitemap)(request)
+    response = HttpResponse(content, content_type='application/xml')
+    response['X-Robots-Tag'] = 'noindex, noodp, noarchive'
+    if last_modified:
+        response['Last-Modified'] = last_modified
+    return response
@@ -0,0 +1,128 @@
+# search/analytics.py
+"""
+Статистика поисковых запросов.
+
+Запись — O(1): счётчик в памяти процесса по (нормализованный запрос, день).
+Раз в SEARCH_STATS_FLUSH_INTERVAL секунд или при SEARCH_STATS_MAX_PENDING
+разных ключей счётчики сбрасываются в QueryStat агрегированными upsert-ами
+одной транзакцией. Остаток сбрасывается при остановке воркера
+(хук worker_exit в gunicorn.conf.py).
+
+Старые дневные строки сворачиваются в недельные, недельные — в месячные
+(compact(), команда compact_search_stats), так что таблица остаётся
+маленькой.
+"""
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from wagtail.search.utils import normalise_query_string
+
+from .models import QueryStat
+
+_pending = Counter()
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def record(query_string):
+    """Учитывает поисковый запрос; в БД пишет только пакетами"""
+    query_string = normalise_query_string(query_string)[:255]
+    if not query_string:
+        return
+
+    with _lock:
+        _pending[(query_string, timezone.localdate())] += 1
+        due = (
+            len(_pending) >= settings.SEARCH_STATS_MAX_PENDING
+            or time.monotonic() - _last_flush >= settings.SEARCH_STATS_FLUSH_INTERVAL
+        )
+
+    if due:
+        flush()
+
+
+def flush():
+    """Сбрасывает накопленные счётчики в БД, возвращает число ключей"""
+    global _pending, _last_flush
+
+    with _lock:
+        pending, _pending = _pending, Counter()
+        _last_flush = time.monotonic()
+
+    if pending:
+        with transaction.atomic():
+            for (query_string, day), hits in pending.items():
+                add_hits(query_string, QueryStat.PERIOD_DAY, day, hits)
+    return len(pending)
+
+
+def add_hits(query_string, period, period_start, hits):
+    stat, created = QueryStat.objects.get_or_create(
+        query_string=query_string,
+        period=period,
+        period_start=period_start,
+        defaults={'hits': hits},
+    )
+    if not created:
+        QueryStat.objects.filter(pk=stat.pk).update(hits=F('hits') + hits)
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def rollup(from_period, to_period, before, bucket):
+    """Сворачивает строки from_period раньше before в бакеты to_period"""
+    old = QueryStat.objects.filter(period=from_period, period_start__lt=before)
+    totals = Counter()
+    for query_string, period_start, hits in old.values_list('query_string', 'period_start', 'hits'):
+        totals[(query_string, bucket(period_start))] += hits
+
+    with transaction.atomic():
+        for (query_string, period_start), hits in totals.items():
+            add_hits(query_string, to_period, period_start, hits)
+        deleted, _ = old.delete()
+    return deleted
+
+
+def compact(keep_days=30, keep_weeks=26):
+    """Дни старше keep_days — в недели, недели старше keep_weeks — в месяцы"""
+    today = timezone.localdate()
+    return {
+        QueryStat.PERIOD_DAY: rollup(
+            QueryStat.PERIOD_DAY, QueryStat.PERIOD_WEEK,
+            week_start(today - timedelta(days=keep_days)), week_start,
+        ),
+        QueryStat.PERIOD_WEEK: rollup(
+            QueryStat.PERIOD_WEEK, QueryStat.PERIOD_MONTH,
+            month_start(today - timedelta(weeks=keep_weeks)), month_start,
+        ),
+    }
+
+
+def top_queries(limit=10, days=30):
+    """Самые частые запросы за days дней: [(запрос, число)], кэш на 10 минут"""
+    key = 'search-top:{}:{}:{}'.format(limit, days, timezone.localdate())
+    result = cache.get(key)
+    if result is None:
+        since = timezone.localdate() - timedelta(days=days)
+        result = list(
+            QueryStat.objects.filter(period_start__gte=since)
+            .values('query_string')
+            .annotate(total=Sum('hits'))
+            .order_by('-total')
+            .values_list('query_string', 'total')[:limit]
+        )
+        cache.set(key, result, 60 * 10)
+    return result
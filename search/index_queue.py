@@ -0,0 +1,158 @@
+# search/index_queue.py
+"""
+Отложенное обновление поискового индекса.
+
+Автообновление индекса Wagtail выключено (AUTO_UPDATE в
+WAGTAILSEARCH_BACKENDS): иначе каждая публикация переиндексирует
+StreamField и RichText-поля прямо в запросе редактора и держит блокировку
+записи SQLite. Вместо этого post_save/post_delete индексируемых моделей
+ставят объект в очередь после коммита транзакции. Повторные изменения
+одного объекта схлопываются, а фоновый поток воркера раз в
+SEARCH_INDEX_QUEUE_DELAY секунд применяет накопленное пачками по
+SEARCH_INDEX_BATCH_SIZE объектов, каждая пачка — одна транзакция.
+
+Очередь живёт в памяти воркера и дописывается при его остановке
+(хук worker_exit в gunicorn.conf.py) или процесса (atexit, для
+management-команд). Если воркер упал, индекс восстанавливает команда
+bulk_update_index.
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections, transaction
+from wagtail.search import index
+from wagtail.search.backends import get_search_backends
+
+logger = logging.getLogger(__name__)
+
+UPDATE = "update"
+DELETE = "delete"
+
+_lock = threading.Lock()
+_wakeup = threading.Event()
+# (модель, pk) -> (UPDATE, None) или (DELETE, экземпляр)
+_pending = {}
+_worker = None
+_worker_pid = None
+
+
+def chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def add(instance, action):
+    key = (type(instance), instance.pk)
+    with _lock:
+        _pending[key] = (action, instance if action == DELETE else None)
+    ensure_worker()
+    _wakeup.set()
+
+
+def enqueue_update(instance):
+    transaction.on_commit(lambda: add(instance, UPDATE))
+
+
+def enqueue_delete(instance):
+    transaction.on_commit(lambda: add(instance, DELETE))
+
+
+def post_save_handler(sender, instance, raw=False, **kwargs):
+    if not raw:
+        enqueue_update(instance)
+
+
+def post_delete_handler(sender, instance, **kwargs):
+    enqueue_delete(instance)
+
+
+def ensure_worker():
+    """Фоновый поток; после fork (preload в gunicorn) запускается заново"""
+    global _worker, _worker_pid
+    with _lock:
+        if _worker is not None and _worker_pid == os.getpid() and _worker.is_alive():
+            return
+        _worker = threading.Thread(target=run, name="search-index-queue", daemon=True)
+        _worker_pid = os.getpid()
+        _worker.start()
+
+
+def run():
+    while True:
+        _wakeup.wait()
+        # Даём накопиться изменениям (массовая публикация)
+        time.sleep(settings.SEARCH_INDEX_QUEUE_DELAY)
+        _wakeup.clear()
+        try:
+            drain()
+        except Exception:
+            logger.exception("Не удалось обновить поисковый индекс")
+        finally:
+            connections.close_all()
+
+
+def drain():
+    """Применяет всю очередь, возвращает число обработанных объектов"""
+    global _pending
+    with _lock:
+        pending, _pending = _pending, {}
+    if not pending:
+        return 0
+
+    updates = defaultdict(list)
+    deletes = []
+    for (model, pk), (action, instance) in pending.items():
+        if action == UPDATE:
+            updates[model].append(pk)
+        else:
+            deletes.append(instance)
+
+    backends = list(get_search_backends())
+    batch_size = settings.SEARCH_INDEX_BATCH_SIZE
+    for model, pks in updates.items():
+        for batch_pks in chunks(pks, batch_size):
+            objects = [
+                indexed
+                for indexed in (
+                    index.get_indexed_instance(obj, check_exists=False)
+                    for obj in model._default_manager.filter(pk__in=batch_pks)
+                )
+                if indexed is not None
+            ]
+            for indexed_model, batch in group_by_model(objects).items():
+                with transaction.atomic():
+                    for backend in backends:
+                        backend.add_bulk(indexed_model, batch)
+
+    for batch in chunks(deletes, batch_size):
+        with transaction.atomic():
+            for instance in batch:
+                for backend in backends:
+                    backend.delete(instance)
+
+    logger.info("Поисковый индекс: обновлено %d, удалено %d", len(pending) - len(deletes), len(deletes))
+    return len(pending)
+
+
+def group_by_model(objects):
+    grouped = defaultdict(list)
+    for obj in objects:
+        if index.class_is_indexed(type(obj)):
+            grouped[type(obj)].append(obj)
+    return grouped
+
+
+atexit.register(drain)
+
+
+def register_signal_handlers():
+    from django.db.models.signals import post_delete, post_save
+
+    for model in index.get_indexed_models():
+        post_save.connect(post_save_handler, sender=model)
+        post_delete.connect(post_delete_handler, sender=model)
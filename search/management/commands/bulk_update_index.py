@@ -0,0 +1,66 @@
+# search/management/commands/bulk_update_index.py
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from wagtail.models import Page
+from wagtail.search import index
+from wagtail.search.backends import get_search_backends
+
+
+class Command(BaseCommand):
+    help = "Переиндексирует все индексируемые модели пачками, с прогрессом и скоростью"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100, help="Объектов в одной транзакции")
+        parser.add_argument("--model", action="append", default=[], help="Только эти модели (app_label.model)")
+
+    def handle(self, *args, **options):
+        backends = list(get_search_backends())
+        only = {label.lower() for label in options["model"]}
+        batch_size = options["batch_size"]
+
+        total_count = 0
+        started = time.perf_counter()
+        for model in index.get_indexed_models():
+            if only and model._meta.label_lower not in only:
+                continue
+            total_count += self.index_model(model, backends, batch_size)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            "Всего: {} объектов за {:.1f} с ({:.0f} об/с)".format(total_count, elapsed, total_count / max(elapsed, 1e-6))
+        )
+
+    def index_model(self, model, backends, batch_size):
+        queryset = model.get_indexed_objects()
+        if issubclass(model, Page):
+            # Каждая страница индексируется один раз, своей конкретной моделью
+            queryset = queryset.filter(content_type=ContentType.objects.get_for_model(model))
+        queryset = queryset.order_by("pk")
+
+        total = queryset.count()
+        label = model._meta.label
+        if not total:
+            return 0
+
+        done = 0
+        last_pk = None
+        started = time.perf_counter()
+        while done < total:
+            batch_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            batch = list(batch_queryset[:batch_size])
+            if not batch:
+                break
+            with transaction.atomic():
+                for backend in backends:
+                    backend.add_bulk(model, batch)
+            done += len(batch)
+            last_pk = batch[-1].pk
+
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                "{}: {}/{} ({:.0f} об/с)".format(label, done, total, done / max(elapsed, 1e-6))
+            )
+        return done
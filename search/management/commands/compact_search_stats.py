@@ -0,0 +1,18 @@
+# search/management/commands/compact_search_stats.py
+from django.core.management.base import BaseCommand
+
+from search import analytics
+
+
+class Command(BaseCommand):
+    help = "Сворачивает старую дневную статистику поиска в недельную, недельную — в месячную"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--keep-days", type=int, default=30, help="Сколько дней хранить дневные строки")
+        parser.add_argument("--keep-weeks", type=int, default=26, help="Сколько недель хранить недельные строки")
+
+    def handle(self, *args, **options):
+        deleted = analytics.compact(options["keep_days"], options["keep_weeks"])
+        self.stdout.write(
+            "Свернуто дневных строк: {day}, недельных: {week}".format(**deleted)
+        )
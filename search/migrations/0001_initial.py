@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="QueryStat",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("query_string", models.CharField(max_length=255, verbose_name="Запрос")),
+                (
+                    "period",
+                    models.CharField(
+                        choices=[("day", "День"), ("week", "Неделя"), ("month", "Месяц")],
+                        default="day",
+                        max_length=5,
+                        verbose_name="Период",
+                    ),
+                ),
+                ("period_start", models.DateField(verbose_name="Начало периода")),
+                ("hits", models.PositiveIntegerField(default=0, verbose_name="Запросов")),
+            ],
+            options={
+                "verbose_name": "Статистика поиска",
+                "verbose_name_plural": "Статистика поиска",
+                "unique_together": {("query_string", "period", "period_start")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="querystat",
+            index=models.Index(fields=["period", "period_start"], name="search_querystat_period_idx"),
+        ),
+    ]
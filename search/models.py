@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class QueryStat(models.Model):
+    """Число поисковых запросов за период (день, неделю или месяц)"""
+
+    PERIOD_DAY = 'day'
+    PERIOD_WEEK = 'week'
+    PERIOD_MONTH = 'month'
+    PERIOD_CHOICES = [
+        (PERIOD_DAY, 'День'),
+        (PERIOD_WEEK, 'Неделя'),
+        (PERIOD_MONTH, 'Месяц'),
+    ]
+
+    query_string = models.CharField("Запрос", max_length=255)
+    period = models.CharField("Период", max_length=5, choices=PERIOD_CHOICES, default=PERIOD_DAY)
+    period_start = models.DateField("Начало периода")
+    hits = models.PositiveIntegerField("Запросов", default=0)
+
+    def __str__(self):
+        return f"{self.query_string} ({self.period} {self.period_start}): {self.hits}"
+
+    class Meta:
+        verbose_name = "Статистика поиска"
+        verbose_name_plural = "Статистика поиска"
+        unique_together = ('query_string', 'period', 'period_start')
+        indexes = [
+            models.Index(fields=['period', 'period_start'], name='search_querystat_period_idx'),
+        ]
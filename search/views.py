@@ -1,21 +1,19 @@
+from asgiref.sync import sync_to_async
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.template.response import TemplateResponse
 
 from wagtail.models import Page
-from wagtail.search.models import Query
 
+from . import analytics
 
-def search(request):
-    search_query = request.GET.get("query", None)
-    page = request.GET.get("page", 1)
 
+def run_search(search_query, page):
     # Search
     if search_query:
         search_results = Page.objects.live().search(search_query)
-        query = Query.get(search_query)
 
-        # Record hit
-        query.add_hit()
+        # Record hit (в памяти, в БД — пакетами)
+        analytics.record(search_query)
     else:
         search_results = Page.objects.none()
 
@@ -28,6 +26,18 @@ def search(request):
     except EmptyPage:
         search_results = paginator.page(paginator.num_pages)
 
+    # Выполняем запрос здесь, а не при рендере шаблона
+    search_results.object_list = list(search_results.object_list)
+    return search_results
+
+
+async def search(request):
+    search_query = request.GET.get("query", None)
+    page = request.GET.get("page", 1)
+
+    # Поиск и запись статистики идут в sync-потоке, event loop не блокируется
+    search_results = await sync_to_async(run_search)(search_query, page)
+
     return TemplateResponse(
         request,
         "search/search.html",
@@ -0,0 +1,20 @@
+# search/wagtail_hooks.py
+from wagtail import hooks
+from wagtail.admin.ui.components import Component
+
+from . import analytics
+
+
+class TopQueriesPanel(Component):
+    """Популярные поисковые запросы на главной странице админки"""
+    name = "top_search_queries"
+    order = 300
+    template_name = "search/top_queries_panel.html"
+
+    def get_context_data(self, parent_context):
+        return {"queries": analytics.top_queries()}
+
+
+@hooks.register("construct_homepage_panels")
+def add_top_queries_panel(request, panels):
+    panels.append(TopQueriesPanel())